@@ -2,7 +2,12 @@
 Feature extraction module for Project Evolution Agents.
 Uses LLM to extract structured feature data from feature proposals text.
 """
+import os
 import re
+import logging
+from collections import Counter, defaultdict
+from functools import lru_cache
+from html import escape
 from direct_agents.agent import Agent
 from direct_agents.task import Task
 from anthropic import Anthropic
@@ -12,6 +17,117 @@ import streamlit.components.v1 as components
 import plotly.graph_objects as go
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Model and system prompt for direct feature extraction calls
+_FEATURE_MODEL = "claude-3-haiku-20240307"
+_FEATURE_SYSTEM_PROMPT = "You are an expert in analyzing feature proposals and extracting structured data about each feature."
+
+# Cell colors for the priority-complexity matrix, keyed by priority then complexity
+_CELL_COLORS = {
+    "High": {
+        "High": "#FFCCCC",  # Red for High Priority, High Complexity
+        "Medium": "#FFE5CC", # Orange for High Priority, Medium Complexity
+        "Low": "#FFFFCC"     # Yellow for High Priority, Low Complexity
+    },
+    "Medium": {
+        "High": "#E5CCFF",   # Purple for Medium Priority, High Complexity
+        "Medium": "#E5E5E5", # Gray for Medium Priority, Medium Complexity
+        "Low": "#CCFFFF"     # Cyan for Medium Priority, Low Complexity
+    },
+    "Low": {
+        "High": "#CCCCFF",   # Blue for Low Priority, High Complexity
+        "Medium": "#CCE5FF", # Light Blue for Low Priority, Medium Complexity
+        "Low": "#CCFFCC"     # Green for Low Priority, Low Complexity
+    }
+}
+
+# Prompt templates for extract_features_with_llm, built once at import.
+# The model is asked for a strict JSON array so the reply can go straight through json.loads;
+# the alignment key is only requested when the user has a priority focus.
+_PROMPT_INTRO = """Extract structured feature data from the following feature proposals text.
+For each feature mentioned, identify:
+1. Feature name
+2. Feature description
+3. Priority level (High, Medium, or Low)
+4. Complexity level (High, Medium, or Low)"""
+
+_PROMPT_OUTRO = """
+
+Here's the feature proposals text to analyze:
+{proposals}"""
+
+_PROMPT_NOPRIORITY = (
+    _PROMPT_INTRO
+    + """
+
+Respond with ONLY a JSON array with one object per feature, using exactly these keys:
+[{{"name": "Feature name", "description": "Feature description", "priority": "High/Medium/Low", "complexity": "High/Medium/Low"}}]"""
+    + _PROMPT_OUTRO
+)
+
+_PROMPT_PRIORITY = (
+    _PROMPT_INTRO
+    + """
+
+IMPORTANT: The user has requested to {priority}. For each feature, also indicate whether it aligns with this priority focus (true or false).
+
+Respond with ONLY a JSON array with one object per feature, using exactly these keys:
+[{{"name": "Feature name", "description": "Feature description", "priority": "High/Medium/Low", "complexity": "High/Medium/Low", "aligns_with_priority": true}}]"""
+    + _PROMPT_OUTRO
+)
+
+# Prompt template for extract_features_with_llm_batch; documents are appended in numbered sections
+_BATCH_PROMPT = _PROMPT_INTRO + """
+
+You will be given several feature proposals documents, each starting with a line like "=== DOC 1 ===".
+Analyze each document separately. For every document, write a line "=== RESULT N ===" using the
+same number, followed by ONLY a JSON array with one object per feature in that document, using exactly these keys:
+[{{"name": "Feature name", "description": "Feature description", "priority": "High/Medium/Low", "complexity": "High/Medium/Low"}}]
+If a document states a priority focus, also include "aligns_with_priority" (true or false) for each of its features.
+Return the results in the same order as the documents.
+
+{documents}"""
+
+# Splits a batch reply into its numbered results
+_RESULT_SPLIT_RE = re.compile(r'^\s*===\s*RESULT\s+(\d+)\s*===\s*$', re.MULTILINE)
+
+@lru_cache(maxsize=1)
+def _get_client(api_key):
+    """Reuse one Anthropic client per API key"""
+    return Anthropic(api_key=api_key)
+
+def _complete(system_prompt, user_content):
+    """
+    Send a single message to the Anthropic API and return the text of the reply.
+    
+    Args:
+        system_prompt (str): Static system prompt
+        user_content (str): The user message
+        
+    Returns:
+        str: The model's reply, or an error message if the call failed
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("Anthropic API key not provided and not found in environment variables")
+    
+    try:
+        message = _get_client(api_key).messages.create(
+            model=_FEATURE_MODEL,
+            max_tokens=4000,
+            temperature=0.7,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": user_content}
+            ]
+        )
+        return message.content[0].text
+    except Exception as e:
+        error_msg = f"Error executing task with Anthropic API: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
+
 def extract_features_with_llm(feature_proposals_text, user_priority_focus=None):
     """
     Extract structured feature data from feature proposals text using LLM.
@@ -23,94 +139,155 @@ def extract_features_with_llm(feature_proposals_text, user_priority_focus=None):
     Returns:
         dict: Structured feature data
     """
-    # Create an agent to extract features
-    feature_extractor = Agent(
-        role="Feature Analyst",
-        goal="Extract structured feature data from feature proposals text",
-        backstory="You are an expert in analyzing feature proposals and extracting structured data about each feature.",
-        verbose=False
-    )
-    
-    # Adjust the task description based on whether there's a user priority focus
-    priority_instruction = ""
-    if user_priority_focus:
-        priority_instruction = "\n\nIMPORTANT: The user has requested to " + user_priority_focus + ". For each feature, also indicate whether it aligns with this priority focus (Yes or No)."
+    # Skip the LLM round-trip when there is nothing meaningful to extract
+    text = (feature_proposals_text or '').strip()
+    if len(text) < 20:
+        return {
+            "features": [],
+            "user_priority_focus": user_priority_focus
+        }
     
-    # Create a task for the agent to extract features
-    # Prepare the format template based on user priority focus
-    format_template = """
-FEATURE 1:
-Name: [feature name]
-Description: [feature description]
-Priority: [High/Medium/Low]
-Complexity: [High/Medium/Low]"""
-    
-    # Add alignment line if user priority focus is specified
+    # Fill the prebuilt prompt template that matches whether there's a user priority focus
     if user_priority_focus:
-        format_template += "\nAligns with User Priority: [Yes/No]"
+        task_description = _PROMPT_PRIORITY.format(priority=user_priority_focus, proposals=text)
+    else:
+        task_description = _PROMPT_NOPRIORITY.format(proposals=text)
     
-    # Create the task with the appropriate description
-    task_description = """Extract structured feature data from the following feature proposals text.
-For each feature mentioned, identify:
-1. Feature name
-2. Feature description
-3. Priority level (High, Medium, or Low)
-4. Complexity level (High, Medium, or Low)"""
+    # A single completion is all we need, so call the API directly rather than through an Agent/Task
+    result = _complete(_FEATURE_SYSTEM_PROMPT, task_description)
     
-    # Add priority instruction if needed
-    task_description += priority_instruction
+    # Parse the JSON reply, falling back to the text parser if the model didn't return valid JSON
+    features = parse_feature_json(result, user_priority_focus)
+    if features is None:
+        features = parse_feature_extraction_result(result, user_priority_focus)
     
-    # Add format instructions
-    task_description += """
+    return {
+        "features": features,
+        "user_priority_focus": user_priority_focus
+    }
 
-Format your response exactly as follows:
-"""
+def extract_features_with_llm_batch(docs):
+    """
+    Extract structured feature data from several feature proposals documents in one LLM call.
+    
+    Args:
+        docs (list): List of (feature_proposals_text, user_priority_focus) tuples
+        
+    Returns:
+        list: Structured feature data for each document, in the same order as docs
+    """
+    results = [None] * len(docs)
+    sections = []
+    
+    # Documents with nothing meaningful to extract don't need to go to the LLM
+    for i, (feature_proposals_text, user_priority_focus) in enumerate(docs):
+        text = (feature_proposals_text or '').strip()
+        if len(text) < 20:
+            results[i] = {"features": [], "user_priority_focus": user_priority_focus}
+            continue
+        
+        focus_line = f"Priority focus: the user has requested to {user_priority_focus}.\n" if user_priority_focus else ""
+        sections.append(f"=== DOC {i + 1} ===\n{focus_line}{text}")
     
-    # Add format template
-    task_description += format_template
+    if not sections:
+        return results
     
-    # Add second feature example
-    feature2_template = """
-
-FEATURE 2:
-Name: [feature name]
-Description: [feature description]
-Priority: [High/Medium/Low]
-Complexity: [High/Medium/Low]"""
+    result = _complete(_FEATURE_SYSTEM_PROMPT, _BATCH_PROMPT.format(documents="\n\n".join(sections)))
     
-    # Add alignment line for second feature if needed
-    if user_priority_focus:
-        feature2_template += "\nAligns with User Priority: [Yes/No]"
+    # re.split with a capture group gives [preamble, number, body, number, body, ...]
+    parts = _RESULT_SPLIT_RE.split(result)
+    segments = {int(number): body for number, body in zip(parts[1::2], parts[2::2])}
     
-    task_description += feature2_template
+    for i, (_, user_priority_focus) in enumerate(docs):
+        if results[i] is not None:
+            continue
+        
+        segment = segments.get(i + 1, "")
+        features = parse_feature_json(segment, user_priority_focus)
+        if features is None:
+            features = parse_feature_extraction_result(segment, user_priority_focus)
+        
+        results[i] = {
+            "features": features,
+            "user_priority_focus": user_priority_focus
+        }
     
-    # Add final instructions and feature proposals text
-    task_description += """
+    return results
 
-And so on for all features.
+# Decodes the feature array out of a longer LLM reply
+_JSON_DECODER = json.JSONDecoder()
 
-Here's the feature proposals text to analyze:
-"""
+def parse_feature_json(result_text, user_priority_focus=None):
+    """
+    Parse a JSON array of features returned by the LLM.
     
-    # Add the actual feature proposals text
-    task_description += feature_proposals_text
+    Args:
+        result_text (str): The text result from the LLM
+        user_priority_focus (str, optional): User's priority focus
+        
+    Returns:
+        list: List of feature dictionaries, or None if the text isn't a JSON array of objects
+    """
+    # Tolerate prose or code fences around the array, including bracketed prose before or after it:
+    # decode one JSON value at each '[' in turn and keep the first non-empty array of objects
+    data = None
+    start = result_text.find('[')
+    while start >= 0:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(result_text, start)
+        except json.JSONDecodeError:
+            value = None
+        if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            data = value
+            break
+        start = result_text.find('[', start + 1)
     
-    extraction_task = Task(
-        description=task_description,
-        agent=feature_extractor,
-        expected_output="Structured feature data"
-    )
+    if data is None:
+        return None
     
-    # Execute the task
-    result = extraction_task.execute()
+    features = []
+    for item in data:
+        if not item.get('name'):
+            continue
+        
+        priority = str(item.get('priority', 'Medium')).capitalize()
+        complexity = str(item.get('complexity', 'Medium')).capitalize()
+        feature = {
+            'name': str(item['name']).strip(),
+            'description': str(item.get('description', 'No description available')).strip(),
+            'priority': priority if priority in ('High', 'Medium', 'Low') else 'Medium',
+            'complexity': complexity if complexity in ('High', 'Medium', 'Low') else 'Medium'
+        }
+        
+        # Accept both JSON booleans and "Yes"/"No" strings
+        if user_priority_focus:
+            aligns = item.get('aligns_with_priority', False)
+            feature['aligns_with_priority'] = aligns.strip().lower() in ('yes', 'true') if isinstance(aligns, str) else bool(aligns)
+        
+        features.append(feature)
     
-    # Parse the result to extract structured feature data
-    features = parse_feature_extraction_result(result, user_priority_focus)
+    return features or None
+
+def _find_level(lowered_section, label):
+    """
+    Find the High/Medium/Low level that follows a label using plain string scans.
     
-    return {
-        "features": features,
-        "user_priority_focus": user_priority_focus
-    }
+    Args:
+        lowered_section (str): Lowercased feature section text
+        label (str): Lowercased label to look for, e.g. 'priority:'
+        
+    Returns:
+        str: "High", "Medium" or "Low", defaulting to "Medium" if not found
+    """
+    start = lowered_section.find(label)
+    while start >= 0:
+        value = lowered_section[start + len(label):start + len(label) + 40].lstrip()
+        for level in ('high', 'medium', 'low'):
+            if value.startswith(level):
+                return level.capitalize()
+        # e.g. "User Priority: Yes" - keep looking for the next occurrence
+        start = lowered_section.find(label, start + len(label))
+    return "Medium"
 
 def parse_feature_extraction_result(result_text, user_priority_focus=None):
     """
@@ -147,21 +324,18 @@ def parse_feature_extraction_result(result_text, user_priority_focus=None):
             if desc_match:
                 feature['description'] = desc_match.group(1).strip()
             
-            # Extract priority with fallback to Medium if not found
-            priority_match = re.search(r'Priority:\s*(High|Medium|Low)', section, re.IGNORECASE)
-            feature['priority'] = priority_match.group(1).capitalize() if priority_match else "Medium"
+            # Labels are matched case-insensitively, as the LLM doesn't always keep our casing
+            lowered = section.lower()
             
-            # Extract complexity with fallback to Medium if not found
-            complexity_match = re.search(r'Complexity:\s*(High|Medium|Low)', section, re.IGNORECASE)
-            feature['complexity'] = complexity_match.group(1).capitalize() if complexity_match else "Medium"
+            # Extract priority and complexity with fallback to Medium if not found
+            feature['priority'] = _find_level(lowered, 'priority:')
+            feature['complexity'] = _find_level(lowered, 'complexity:')
             
             # Extract alignment with user priority if applicable
             if user_priority_focus:
-                align_match = re.search(r'Aligns with User Priority:\s*(Yes|No)', section, re.IGNORECASE)
-                if align_match:
-                    feature['aligns_with_priority'] = align_match.group(1).lower() == 'yes'
-                else:
-                    feature['aligns_with_priority'] = False
+                label = 'aligns with user priority:'
+                idx = lowered.find(label)
+                feature['aligns_with_priority'] = idx >= 0 and lowered[idx + len(label):idx + len(label) + 40].lstrip().startswith('yes')
             
             # Add the feature to the list if it has at least a name
             if 'name' in feature:
@@ -337,6 +511,21 @@ def render_feature_visualization(feature_data):
         # Create a priority distribution chart
         create_priority_distribution_chart(features, user_priority_focus)
 
+def _bucket_features(features):
+    """
+    Group features by their (priority, complexity) cell in a single pass
+    
+    Args:
+        features (list): List of feature dictionaries
+        
+    Returns:
+        defaultdict: Lists of features keyed by (priority, complexity)
+    """
+    buckets = defaultdict(list)
+    for feature in features:
+        buckets[(feature.get('priority', 'Medium'), feature.get('complexity', 'Medium'))].append(feature)
+    return buckets
+
 def create_priority_complexity_matrix(features, user_priority_focus=None):
     """
     Create a priority-complexity matrix visualization
@@ -349,22 +538,15 @@ def create_priority_complexity_matrix(features, user_priority_focus=None):
     st.markdown('<div class="section-title">📊 Priority-Complexity Matrix</div>', unsafe_allow_html=True)
     
     # Count features in each cell
-    matrix_data = {
-        priority: {complexity: 0 for complexity in ["Low", "Medium", "High"]}
+    buckets = _bucket_features(features)
+    counts = [
+        [len(buckets.get((priority, complexity), ())) for complexity in ["Low", "Medium", "High"]]
         for priority in ["High", "Medium", "Low"]
-    }
-    
-    # Count features in each cell
-    for feature in features:
-        priority = feature.get('priority', 'Medium')
-        complexity = feature.get('complexity', 'Medium')
-        matrix_data[priority][complexity] += 1
+    ]
     
     # Create the heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=[[matrix_data["High"]["Low"], matrix_data["High"]["Medium"], matrix_data["High"]["High"]],
-           [matrix_data["Medium"]["Low"], matrix_data["Medium"]["Medium"], matrix_data["Medium"]["High"]],
-           [matrix_data["Low"]["Low"], matrix_data["Low"]["Medium"], matrix_data["Low"]["High"]]],
+        z=counts,
         x=["Low", "Medium", "High"],
         y=["High", "Medium", "Low"],
         hoverongaps=False,
@@ -374,9 +556,7 @@ def create_priority_complexity_matrix(features, user_priority_focus=None):
             [1, "#EF5350"]   # Red for highest values
         ],
         showscale=False,
-        text=[[f"{matrix_data['High']['Low']} features", f"{matrix_data['High']['Medium']} features", f"{matrix_data['High']['High']} features"],
-              [f"{matrix_data['Medium']['Low']} features", f"{matrix_data['Medium']['Medium']} features", f"{matrix_data['Medium']['High']} features"],
-              [f"{matrix_data['Low']['Low']} features", f"{matrix_data['Low']['Medium']} features", f"{matrix_data['Low']['High']} features"]],
+        text=[[f"{count} features" for count in row] for row in counts],
         texttemplate="%{text}",
         textfont={"size":12}
     ))
@@ -393,28 +573,23 @@ def create_priority_complexity_matrix(features, user_priority_focus=None):
     
     st.plotly_chart(fig, use_container_width=True)
 
-def create_priority_distribution_chart(features, user_priority_focus=None):
+@st.cache_resource(show_spinner=False)
+def _build_priority_fig(priority_counts):
     """
-    Create a priority distribution chart
+    Build the priority distribution bar chart, cached per set of counts
     
     Args:
-        features (list): List of feature dictionaries
-        user_priority_focus (str, optional): User's priority focus
+        priority_counts (tuple): Feature counts for High, Medium and Low priority
+        
+    Returns:
+        go.Figure: The bar chart
     """
-    # Count features by priority
-    priority_counts = {"High": 0, "Medium": 0, "Low": 0}
-    
-    for feature in features:
-        priority = feature.get('priority', 'Medium')
-        priority_counts[priority] += 1
-    
-    # Create the chart
     fig = go.Figure(data=[
         go.Bar(
-            x=list(priority_counts.keys()),
-            y=list(priority_counts.values()),
+            x=["High", "Medium", "Low"],
+            y=list(priority_counts),
             marker_color=["#EF5350", "#FFB74D", "#66BB6A"],
-            text=list(priority_counts.values()),
+            text=list(priority_counts),
             textposition="auto"
         )
     ])
@@ -427,20 +602,36 @@ def create_priority_distribution_chart(features, user_priority_focus=None):
         margin=dict(l=40, r=40, t=40, b=40)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-def render_feature_matrix(features):
+def create_priority_distribution_chart(features, user_priority_focus=None):
     """
-    Render a priority-complexity matrix for features
+    Create a priority distribution chart
     
     Args:
-        features (list): List of feature dictionaries with name, priority, and complexity
+        features (list): List of feature dictionaries
+        user_priority_focus (str, optional): User's priority focus
     """
-    # Create a 3x3 matrix for Priority (High, Medium, Low) vs Complexity (High, Medium, Low)
-    st.markdown('<div class="section-title">🔄 Priority-Complexity Matrix</div>', unsafe_allow_html=True)
+    # Count features by priority in a single pass
+    counts = Counter(feature.get('priority', 'Medium') for feature in features)
+    priority_counts = tuple(counts[priority] for priority in ["High", "Medium", "Low"])
+    
+    # The figure only depends on the counts, so reruns with the same counts reuse it
+    st.plotly_chart(_build_priority_fig(priority_counts), use_container_width=True)
+
+def _build_matrix_html(features, has_priority_focus):
+    """
+    Build the priority-complexity matrix as an HTML table
     
-    # Create the matrix as an HTML table
-    matrix_html = """
+    Args:
+        features (list): List of feature dictionaries with name, priority, and complexity
+        has_priority_focus (bool): Whether to highlight priority-aligned features
+        
+    Returns:
+        str: HTML for the matrix
+    """
+    # Collect the table pieces and join once instead of growing a string cell by cell
+    parts = ["""
     <div style="margin: 20px 0;">
     <table style="width: 100%; border-collapse: collapse; text-align: center;">
         <tr>
@@ -449,65 +640,94 @@ def render_feature_matrix(features):
             <th style="border: 1px solid #ddd; padding: 15px; background-color: #f2f2f2;">Medium Complexity</th>
             <th style="border: 1px solid #ddd; padding: 15px; background-color: #f2f2f2;">High Complexity</th>
         </tr>
-    """
-    
-    # Define cell colors
-    cell_colors = {
-        "High": {
-            "High": "#FFCCCC",  # Red for High Priority, High Complexity
-            "Medium": "#FFE5CC", # Orange for High Priority, Medium Complexity
-            "Low": "#FFFFCC"     # Yellow for High Priority, Low Complexity
-        },
-        "Medium": {
-            "High": "#E5CCFF",   # Purple for Medium Priority, High Complexity
-            "Medium": "#E5E5E5", # Gray for Medium Priority, Medium Complexity
-            "Low": "#CCFFFF"     # Cyan for Medium Priority, Low Complexity
-        },
-        "Low": {
-            "High": "#CCCCFF",   # Blue for Low Priority, High Complexity
-            "Medium": "#CCE5FF", # Light Blue for Low Priority, Medium Complexity
-            "Low": "#CCFFCC"     # Green for Low Priority, Low Complexity
-        }
-    }
+    """]
     
-    # Check if we have user priority focus information
-    has_priority_focus = any('aligns_with_priority' in feature for feature in features)
+    # Bucket features by (priority, complexity) once instead of scanning the list per cell
+    buckets = _bucket_features(features)
     
     # Add rows for each priority level
     for priority in ["High", "Medium", "Low"]:
-        matrix_html += f"""
+        parts.append(f"""
         <tr>
             <td style="border: 1px solid #ddd; padding: 15px; font-weight: bold; background-color: #f2f2f2;">{priority} Priority</td>
-        """
+        """)
         
         # Add cells for each complexity level
         for complexity in ["Low", "Medium", "High"]:
             # Get features that match this priority and complexity with defaults for missing fields
-            features_in_cell = [f for f in features if f.get('priority', 'Medium') == priority and f.get('complexity', 'Medium') == complexity]
+            features_in_cell = buckets.get((priority, complexity), ())
             
             # Get the cell color
-            cell_color = cell_colors[priority][complexity]
+            cell_color = _CELL_COLORS[priority][complexity]
             
             # Create a list of feature names for this cell
             feature_items = []
             for feature in features_in_cell:
                 if has_priority_focus and feature.get("aligns_with_priority", False):
                     # Add a star for priority-aligned features
-                    feature_items.append(f"• <span style=\"font-weight: bold; color: #4CAF50;\">{feature.get('name', 'Unnamed')} ⭐</span>")
+                    feature_items.append(f"• <span style=\"font-weight: bold; color: #4CAF50;\">{escape(feature.get('name', 'Unnamed'))} ⭐</span>")
                 else:
-                    feature_items.append(f"• {feature.get('name', 'Unnamed')}")
+                    feature_items.append(f"• {escape(feature.get('name', 'Unnamed'))}")
             
             feature_list = "<br>".join(feature_items) if feature_items else "No features"
             
-            matrix_html += f"""
+            parts.append(f"""
             <td style="border: 1px solid #ddd; padding: 15px; vertical-align: top; background-color: {cell_color};">
                 {feature_list}
             </td>
-            """
+            """)
         
-        matrix_html += "</tr>"
+        parts.append("</tr>")
+    
+    parts.append("</table></div>")
+    
+    return "".join(parts)
+
+def _matrix_signature(features):
+    """
+    Reduce features to a hashable signature of the fields the matrix displays
     
-    matrix_html += "</table></div>"
+    Args:
+        features (list): List of feature dictionaries
+        
+    Returns:
+        tuple: (name, priority, complexity, aligns_with_priority) per feature, in input order
+    """
+    return tuple(
+        (f.get('name', 'Unnamed'), f.get('priority', 'Medium'), f.get('complexity', 'Medium'), f.get('aligns_with_priority', False))
+        for f in features
+    )
+
+@st.cache_data(show_spinner=False)
+def _matrix_html(signature, has_priority_focus):
+    """
+    Cached matrix HTML for a feature signature, so reruns with unchanged features skip the rebuild
+    
+    Args:
+        signature (tuple): Output of _matrix_signature
+        has_priority_focus (bool): Whether to highlight priority-aligned features
+        
+    Returns:
+        str: HTML for the matrix
+    """
+    features = [
+        {'name': name, 'priority': priority, 'complexity': complexity, 'aligns_with_priority': aligns}
+        for name, priority, complexity, aligns in signature
+    ]
+    return _build_matrix_html(features, has_priority_focus)
+
+def render_feature_matrix(features):
+    """
+    Render a priority-complexity matrix for features
+    
+    Args:
+        features (list): List of feature dictionaries with name, priority, and complexity
+    """
+    # Create a 3x3 matrix for Priority (High, Medium, Low) vs Complexity (High, Medium, Low)
+    st.markdown('<div class="section-title">🔄 Priority-Complexity Matrix</div>', unsafe_allow_html=True)
+    
+    # Check if we have user priority focus information
+    has_priority_focus = any('aligns_with_priority' in feature for feature in features)
     
     # Display the matrix
-    components.html(matrix_html, height=350)
+    components.html(_matrix_html(_matrix_signature(features), has_priority_focus), height=350)
@@ -1,8 +1,107 @@
+import streamlit as st
 import streamlit.components.v1 as components
+from html import escape
 
+from visualization_utils import fragment
+
+# Index of each Low/Medium/High level into the color tuples below
+_LEVEL_IDX = {"Low": 0, "Medium": 1, "High": 2}
+_PRIORITY_COLORS = ("#90CAF9", "#FFB74D", "#EF5350")
+_COMPLEXITY_COLORS = ("#A5D6A7", "#FFE082", "#FFAB91")
+
+# The details card uses its own priority palette; anything else falls back to blue
+_DETAIL_PRIORITY_COLORS = {"High": "#4CAF50", "Medium": "#FFC107"}
+
+# Translucent row backgrounds for priority-aligned features, parsed from the hex colors once
+_PRIORITY_RGBA = tuple(f'rgba({int(c[1:3], 16)}, {int(c[3:5], 16)}, {int(c[5:7], 16)}, 0.2)' for c in _PRIORITY_COLORS)
+
+# Static HTML blocks for the feature table and feature details card
+_TABLE_FOOTER = '''
+        </tbody>
+    </table>
+    </div>
+    '''
+
+_BENEFITS_HEADER = '''
+                <div style="margin-top: 20px;">
+                    <div style="font-weight: bold; color: #555; margin-bottom: 10px;">Key Benefits:</div>
+                    <ul style="margin-top: 5px; padding-left: 20px;">
+        '''
+
+_CONSIDERATIONS_HEADER = '''
+                <div style="margin-top: 20px;">
+                    <div style="font-weight: bold; color: #555; margin-bottom: 10px;">Implementation Considerations:</div>
+                    <ul style="margin-top: 5px; padding-left: 20px;">
+        '''
+
+_LIST_FOOTER = '''
+                    </ul>
+                </div>
+        '''
+
+_DETAILS_FOOTER = '''
+            </div>
+        </div>
+    </div>
+    '''
+
+def _row_template(priority, complexity, aligned):
+    """
+    Build a feature table row template with the colors and alignment cell already filled in
+    
+    Args:
+        priority (str): Priority level shown in the row
+        complexity (str): Complexity level shown in the row
+        aligned (bool or None): Whether the feature aligns with the priority focus, or None without a focus
+    Returns:
+        str: Row HTML with only {name} and {description} left to format
+    """
+    # Unknown levels fall back to the High color, as before
+    pi = _LEVEL_IDX.get(priority, 2)
+    priority_color = _PRIORITY_COLORS[pi]
+    complexity_color = _COMPLEXITY_COLORS[_LEVEL_IDX.get(complexity, 2)]
+    row_style = f"background-color: {_PRIORITY_RGBA[pi] if aligned else '#f9f9f9'};"
+    
+    # Create alignment indicator
+    alignment_cell = f'''
+            <td style="padding: 12px; text-align: center; border: 1px solid #ddd;">
+                {f'<span style="color: {priority_color}; font-weight: bold;">✓</span>' if aligned else '–'}
+            </td>
+        ''' if aligned is not None else ''
+    
+    # Level text is shown as given, so escape it and protect any braces from the later format call
+    priority = escape(priority).replace('{', '{{').replace('}', '}}')
+    complexity = escape(complexity).replace('{', '{{').replace('}', '}}')
+    
+    return f'''
+        <tr style="{row_style}">
+            <td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{{name}}</td>
+            <td style="padding: 12px; text-align: center; border: 1px solid #ddd; background-color: {priority_color};">{priority}</td>
+            <td style="padding: 12px; text-align: center; border: 1px solid #ddd; background-color: {complexity_color};">{complexity}</td>
+            <td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{{description}}</td>
+            {alignment_cell}
+        </tr>
+        '''
+
+# Row templates for every known (priority, complexity, aligned) combination, built once at import
+_ROW_TEMPLATES = {
+    (priority, complexity, aligned): _row_template(priority, complexity, aligned)
+    for priority in _LEVEL_IDX
+    for complexity in _LEVEL_IDX
+    for aligned in (None, False, True)
+}
+
+# Number of feature rows rendered per "Load more" page
+_PAGE = 25
+
+def _load_more_features(page_key):
+    """Reveal the next page of rows in the feature details table whose page count is stored under page_key"""
+    st.session_state[page_key] += 1
+
+@fragment
 def render_feature_details_table(features):
     """
-    Render a feature details table using components.html
+    Render a feature details table using components.html, _PAGE rows at a time
     
     Args:
         features: List of feature dictionaries with name, priority, complexity, and description
@@ -17,6 +116,53 @@ def render_feature_details_table(features):
                 user_priority_focus = feature['user_priority_focus']
                 break
     
+    # Split the features into hashable per-field columns once, so the table HTML can be cached
+    # across reruns and the row loop indexes tuples instead of looking up dict keys.
+    # Names and descriptions are escaped here, once per distinct input, rather than per row.
+    names = tuple(escape(feature["name"]) for feature in features)
+    priorities = tuple(feature["priority"] for feature in features)
+    complexities = tuple(feature["complexity"] for feature in features)
+    descriptions = tuple(escape(feature["description"]) for feature in features)
+    aligns = tuple(feature.get("aligns_with_priority", False) for feature in features)
+    
+    # Only render the pages revealed so far, so the iframe stays small for long feature lists.
+    # The page count and button are keyed on the feature signature, so a new feature list starts
+    # again at the first page and tables for different feature lists do not share a key.
+    page_key = f"feat_page_{hash((names, priorities, complexities, descriptions, aligns))}"
+    if page_key not in st.session_state:
+        st.session_state[page_key] = 1
+    total = len(features)
+    shown = min(st.session_state[page_key] * _PAGE, total)
+    
+    # Use components.html for the table
+    components.html(
+        _build_feature_table_html(
+            names[:shown], priorities[:shown], complexities[:shown], descriptions[:shown], aligns[:shown],
+            has_priority_focus, user_priority_focus
+        ),
+        height=shown * 50 + 350
+    )
+    
+    if shown < total:
+        st.button(f"Load more ({total - shown} remaining)", key=f"{page_key}_more", on_click=_load_more_features, args=(page_key,))
+
+@st.cache_data(show_spinner=False)
+def _build_feature_table_html(names, priorities, complexities, descriptions, aligns, has_priority_focus, user_priority_focus):
+    """
+    Build the feature details table HTML, cached per set of feature columns
+    
+    Args:
+        names: Tuple of HTML-escaped feature names
+        priorities: Tuple of feature priorities, parallel to names
+        complexities: Tuple of feature complexities, parallel to names
+        descriptions: Tuple of HTML-escaped feature descriptions, parallel to names
+        aligns: Tuple of aligns_with_priority flags, parallel to names
+        has_priority_focus: Whether to show the priority alignment column
+        user_priority_focus: The user's priority focus, if any
+        
+    Returns:
+        str: HTML for the table
+    """
     # Create a priority focus banner if applicable
     priority_banner = ""
     priority_color = "#9575CD"  # Default color
@@ -28,13 +174,13 @@ def render_feature_details_table(features):
         
         priority_banner = f'''
         <div style="padding: 10px; background-color: {priority_color}; color: white; border-radius: 5px; margin-bottom: 15px; text-align: center;">
-            <h3 style="margin: 0;">Priority Focus: {user_priority_focus}</h3>
+            <h3 style="margin: 0;">Priority Focus: {escape(user_priority_focus)}</h3>
             <p style="margin: 5px 0 0 0;">Features aligned with this priority are highlighted</p>
         </div>
         '''
     
-    # Create a styled table
-    html_table = f'''
+    # Collect the table pieces and join once instead of growing a string row by row
+    parts = [f'''
     <div style="overflow-x: auto;">
     {priority_banner}
     <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">
@@ -48,42 +194,20 @@ def render_feature_details_table(features):
             </tr>
         </thead>
         <tbody>
-    '''
+    ''']
     
-    for feature in features:
-        # Set colors based on priority and complexity
-        priority_color = "#90CAF9" if feature["priority"] == "Low" else "#FFB74D" if feature["priority"] == "Medium" else "#EF5350"
-        complexity_color = "#A5D6A7" if feature["complexity"] == "Low" else "#FFE082" if feature["complexity"] == "Medium" else "#FFAB91"
-        
-        # Check if feature aligns with priority
-        aligns_with_priority = feature.get("aligns_with_priority", False) if has_priority_focus else False
-        row_style = f"background-color: {f'rgba({int(priority_color[1:3], 16)}, {int(priority_color[3:5], 16)}, {int(priority_color[5:7], 16)}, 0.2)' if aligns_with_priority else '#f9f9f9'};"
-        
-        # Create alignment indicator
-        alignment_cell = f'''
-            <td style="padding: 12px; text-align: center; border: 1px solid #ddd;">
-                {f'<span style="color: {priority_color}; font-weight: bold;">✓</span>' if aligns_with_priority else '–'}
-            </td>
-        ''' if has_priority_focus else ''
+    for i in range(len(names)):
+        # Alignment only matters when there is a priority focus
+        aligned = bool(aligns[i]) if has_priority_focus else None
+        key = (priorities[i], complexities[i], aligned)
         
-        html_table += f'''
-        <tr style="{row_style}">
-            <td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{feature["name"]}</td>
-            <td style="padding: 12px; text-align: center; border: 1px solid #ddd; background-color: {priority_color};">{feature["priority"]}</td>
-            <td style="padding: 12px; text-align: center; border: 1px solid #ddd; background-color: {complexity_color};">{feature["complexity"]}</td>
-            <td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{feature["description"]}</td>
-            {alignment_cell}
-        </tr>
-        '''
+        # Known levels use a prebuilt template; anything else is built on the fly
+        row_template = _ROW_TEMPLATES.get(key) or _row_template(*key)
+        parts.append(row_template.format(name=names[i], description=descriptions[i]))
     
-    html_table += '''
-        </tbody>
-    </table>
-    </div>
-    '''
+    parts.append(_TABLE_FOOTER)
     
-    # Use components.html for the table
-    components.html(html_table, height=len(features) * 50 + 350)
+    return "".join(parts)
 
 def render_feature_details(feature):
     """
@@ -101,14 +225,38 @@ def render_feature_details(feature):
     benefits = feature.get("benefits", ["Improves user experience"])
     considerations = feature.get("considerations", ["Requires thorough testing"])
     
-    # Set colors based on priority
-    priority_color = "#4CAF50" if priority == "High" else "#FFC107" if priority == "Medium" else "#2196F3"
+    # Use components.html for the feature details
+    components.html(
+        _build_feature_details_html(name, description, priority, complexity, user_impact, tuple(benefits or ()), tuple(considerations or ())),
+        height=500
+    )
+
+@st.cache_data(show_spinner=False)
+def _build_feature_details_html(name, description, priority, complexity, user_impact, benefits, considerations):
+    """
+    Build the feature details card HTML, cached per feature
+    
+    Args:
+        name, description, priority, complexity, user_impact: Feature fields
+        benefits: Tuple of benefit strings
+        considerations: Tuple of implementation consideration strings
+        
+    Returns:
+        str: HTML for the feature details card
+    """
+    # Set colors based on priority, complexity and user impact
+    priority_color = _DETAIL_PRIORITY_COLORS.get(priority, "#2196F3")
+    complexity_color = _COMPLEXITY_COLORS[_LEVEL_IDX.get(complexity, 2)]
+    user_impact_color = _PRIORITY_COLORS[_LEVEL_IDX.get(user_impact, 2)]
+    
+    # Escape the level text once colors are picked, since it is shown as given
+    priority, complexity, user_impact = escape(priority), escape(complexity), escape(user_impact)
     
     # Create HTML for feature details
-    feature_html = f'''
+    parts = [f'''
     <div style="margin-top: 20px; margin-bottom: 20px;">
         <div style="background-color: #F5F5F5; border-radius: 8px; padding: 20px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-            <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid {priority_color}; padding-bottom: 10px;">{name}</h3>
+            <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid {priority_color}; padding-bottom: 10px;">{escape(name)}</h3>
             
             <div style="margin-top: 15px;">
                 <div style="display: flex; margin-bottom: 15px;">
@@ -121,66 +269,47 @@ def render_feature_details(feature):
                 <div style="display: flex; margin-bottom: 15px;">
                     <div style="width: 120px; font-weight: bold; color: #555;">Complexity:</div>
                     <div>
-                        <span style="background-color: {"#A5D6A7" if complexity == "Low" else "#FFE082" if complexity == "Medium" else "#FFAB91"}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 14px;">{complexity}</span>
+                        <span style="background-color: {complexity_color}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 14px;">{complexity}</span>
                     </div>
                 </div>
                 
                 <div style="display: flex; margin-bottom: 15px;">
                     <div style="width: 120px; font-weight: bold; color: #555;">User Impact:</div>
                     <div>
-                        <span style="background-color: {"#90CAF9" if user_impact == "Low" else "#FFB74D" if user_impact == "Medium" else "#EF5350"}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 14px;">{user_impact}</span>
+                        <span style="background-color: {user_impact_color}; color: white; padding: 3px 10px; border-radius: 12px; font-size: 14px;">{user_impact}</span>
                     </div>
                 </div>
                 
                 <div style="margin-top: 20px;">
                     <div style="font-weight: bold; color: #555; margin-bottom: 10px;">Description:</div>
                     <div style="background-color: white; padding: 15px; border-radius: 8px; border-left: 4px solid {priority_color};">
-                        {description}
+                        {escape(description)}
                     </div>
                 </div>
-    '''
+    ''']
     
     # Add benefits if available
     if benefits:
-        feature_html += '''
-                <div style="margin-top: 20px;">
-                    <div style="font-weight: bold; color: #555; margin-bottom: 10px;">Key Benefits:</div>
-                    <ul style="margin-top: 5px; padding-left: 20px;">
-        '''
+        parts.append(_BENEFITS_HEADER)
         
         for benefit in benefits:
-            feature_html += f'<li style="margin-bottom: 8px;">{benefit}</li>'
+            parts.append(f'<li style="margin-bottom: 8px;">{escape(benefit)}</li>')
         
-        feature_html += '''
-                    </ul>
-                </div>
-        '''
+        parts.append(_LIST_FOOTER)
     
     # Add implementation considerations if available
     if considerations:
-        feature_html += '''
-                <div style="margin-top: 20px;">
-                    <div style="font-weight: bold; color: #555; margin-bottom: 10px;">Implementation Considerations:</div>
-                    <ul style="margin-top: 5px; padding-left: 20px;">
-        '''
+        parts.append(_CONSIDERATIONS_HEADER)
         
         for consideration in considerations:
-            feature_html += f'<li style="margin-bottom: 8px;">{consideration}</li>'
+            parts.append(f'<li style="margin-bottom: 8px;">{escape(consideration)}</li>')
         
-        feature_html += '''
-                    </ul>
-                </div>
-        '''
+        parts.append(_LIST_FOOTER)
     
     # Close the HTML
-    feature_html += '''
-            </div>
-        </div>
-    </div>
-    '''
+    parts.append(_DETAILS_FOOTER)
     
-    # Use components.html for the feature details
-    components.html(feature_html, height=500)
+    return "".join(parts)
 
 def render_sample_feature_details():
     """
@@ -0,0 +1,151 @@
+import streamlit as st
+import numpy as np
+from html import escape
+
+from visualization_utils import SENTIMENT_COLORS
+
+# The feedback trends graph lives apart from feedback_visualizations so its large HTML literals are only
+# loaded by pages that draw it: from feedback_trends import create_feedback_trends_graph
+
+# Static HTML blocks for the trends graph
+_TRENDS_AXES = '''
+    <div style="margin-top: 30px; margin-bottom: 30px;">
+        <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid #673AB7; padding-bottom: 8px;">Feedback Impact Analysis</h3>
+        
+        <div style="position: relative; width: 100%; height: 300px; margin-top: 20px; border: 1px solid #ddd; border-radius: 8px; padding: 10px;">
+            <!-- Y-axis label -->
+            <div style="position: absolute; left: -40px; top: 50%; transform: translateY(-50%) rotate(-90deg); font-weight: 500; color: #555;">Impact Severity</div>
+            
+            <!-- X-axis label -->
+            <div style="position: absolute; bottom: -30px; left: 50%; transform: translateX(-50%); font-weight: 500; color: #555;">Mention Frequency</div>
+            
+            <!-- Y-axis -->
+            <div style="position: absolute; left: 50px; top: 20px; bottom: 50px; width: 1px; background-color: #aaa;"></div>
+            
+            <!-- X-axis -->
+            <div style="position: absolute; left: 50px; right: 20px; bottom: 50px; height: 1px; background-color: #aaa;"></div>
+            
+            <!-- Y-axis ticks -->
+            <div style="position: absolute; left: 45px; top: 20px; width: 10px; height: 1px; background-color: #aaa;"></div>
+            <div style="position: absolute; left: 35px; top: 20px; font-size: 12px; color: #777;">High</div>
+            
+            <div style="position: absolute; left: 45px; top: 50%; width: 10px; height: 1px; background-color: #aaa;"></div>
+            <div style="position: absolute; left: 35px; top: calc(50% - 10px); font-size: 12px; color: #777;">Med</div>
+            
+            <div style="position: absolute; left: 45px; bottom: 50px; width: 10px; height: 1px; background-color: #aaa;"></div>
+            <div style="position: absolute; left: 35px; bottom: 40px; font-size: 12px; color: #777;">Low</div>
+            
+            <!-- X-axis ticks -->
+            <div style="position: absolute; left: 50px; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
+            <div style="position: absolute; left: 45px; bottom: 30px; font-size: 12px; color: #777;">0</div>
+            
+            <div style="position: absolute; left: 50%; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
+            <div style="position: absolute; left: calc(50% - 5px); bottom: 30px; font-size: 12px; color: #777;">5</div>
+            
+            <div style="position: absolute; right: 20px; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
+            <div style="position: absolute; right: 15px; bottom: 30px; font-size: 12px; color: #777;">10</div>
+    '''
+
+_TRENDS_LEGEND_HEADER = '''
+        <div style="position: absolute; top: 20px; right: 20px; background-color: white; border: 1px solid #ddd; border-radius: 4px; padding: 10px;">
+            <div style="font-weight: 500; margin-bottom: 5px;">Legend</div>
+    '''
+
+_TRENDS_FOOTER = '''
+        </div>
+    </div>
+    
+    <div style="margin-top: 20px;">
+        <h4 style="margin-top: 0; color: #555;">Insight:</h4>
+        <p style="margin-top: 5px; color: #666;">
+            The graph plots feedback categories by mention frequency (x-axis) and impact severity (y-axis). 
+            Items in the upper-right quadrant represent high-priority issues that are both frequently mentioned and have high impact.
+            Bubble color indicates sentiment (green = positive, blue = neutral, red = negative).
+        </p>
+    </div>
+    </div>'''
+
+# Row templates; only the per-row values are formatted in at render time
+_BUBBLE_TMPL = '''
+        <div style="position: absolute; left: calc(50px + {x}% * calc(100% - 70px) / 100); top: calc(20px + {y}% * calc(100% - 70px) / 100); transform: translate(-50%, -50%); width: {size}px; height: {size}px; background-color: {color}80; border: 2px solid {color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: #333; font-weight: 500; font-size: 12px;" title="{name} ({count} mentions)">
+            {number}
+        </div>
+        '''
+
+_LEGEND_ITEM_TMPL = '''
+            <div style="display: flex; align-items: center; margin-bottom: 5px;">
+                <div style="width: 15px; height: 15px; border-radius: 50%; background-color: {color}; margin-right: 5px; display: flex; align-items: center; justify-content: center; color: white; font-size: 10px;">{number}</div>
+                <div style="font-size: 12px;">{name}</div>
+            </div>
+        '''
+
+def _sentiment_color(sentiment):
+    """Pick the trends graph color for the overall sentiment: green if positive, red if negative, otherwise blue"""
+    if sentiment['positive'] > sentiment['negative'] + 10:
+        return SENTIMENT_COLORS["positive"]
+    if sentiment['negative'] > sentiment['positive'] + 10:
+        return SENTIMENT_COLORS["negative"]
+    return SENTIMENT_COLORS["neutral"]
+
+def _yield_bubbles(categories, sentiment):
+    """Yield the HTML for each category bubble of the trends graph
+    
+    Args:
+        categories: List of category dictionaries with HTML-escaped names
+        sentiment: Dictionary of positive, neutral and negative percentages
+        
+    Yields:
+        str: HTML for one bubble
+    """
+    # Position and size every bubble at once from the counts (all-zero counts, as in the default categories, scale by 1)
+    counts = np.fromiter((c["count"] for c in categories), dtype=np.int64, count=len(categories))
+    max_count = max(int(counts.max(initial=0)), 1)
+    # X-position based on count, bubble size based on total mentions
+    x_percents = ((counts / max_count) * 100).tolist()
+    bubble_sizes = (20 + counts * 5).tolist()
+    
+    # Y-position based on sentiment impact (using negative sentiment percentage as a proxy for severity)
+    # Higher negative sentiment means higher on the y-axis (more severe)
+    severity = sentiment['negative'] / 100
+    y_percent = 100 - (severity * 100)
+    
+    # Bubble color depends only on the overall sentiment, so pick it once
+    color = _sentiment_color(sentiment)
+    
+    for i, (category, x_percent, bubble_size) in enumerate(zip(categories, x_percents, bubble_sizes)):
+        yield _BUBBLE_TMPL.format(
+            x=x_percent, y=y_percent, size=bubble_size, color=color,
+            name=category['category'], count=category['count'], number=i + 1
+        )
+
+def create_feedback_trends_graph(categories, sentiment):
+    """Create a feedback trends graph visualization"""
+    return _feedback_trends_html(
+        tuple((escape(c['category']), c['count']) for c in categories),
+        (sentiment['positive'], sentiment['neutral'], sentiment['negative'])
+    )
+
+@st.cache_data(show_spinner=False)
+def _feedback_trends_html(category_counts, sentiment_values):
+    """Build the feedback trends graph HTML, cached per escaped categories and sentiment"""
+    categories = [{"category": name, "count": count} for name, count in category_counts]
+    sentiment = dict(zip(('positive', 'neutral', 'negative'), sentiment_values))
+    
+    # Create a scatter plot showing category count vs sentiment impact
+    parts = [_TRENDS_AXES]
+    
+    # Add data points (bubbles)
+    parts.extend(_yield_bubbles(categories, sentiment))
+    
+    # Add legend
+    parts.append(_TRENDS_LEGEND_HEADER)
+    
+    # Add legend items for each category, all in the overall sentiment color
+    color = _sentiment_color(sentiment)
+    for i, category in enumerate(categories):
+        parts.append(_LEGEND_ITEM_TMPL.format(color=color, number=i + 1, name=category["category"]))
+    
+    # Close the legend and plot area, then add the quadrant analysis section
+    parts.append(_TRENDS_FOOTER)
+    
+    return "".join(parts)
@@ -1,138 +1,306 @@
 import streamlit as st
 import streamlit.components.v1 as components
+import numpy as np
+import pandas as pd
 import re
+import json
+from functools import lru_cache
+from html import escape
 
-def render_feedback_analysis_visualization(feedback_analysis_text, raw_feedback=None):
+from visualization_utils import SENTIMENT_COLORS, fragment
+
+# Patterns used to pull categories and sentiment out of the feedback analysis text, compiled once
+_CATEGORY_RE = re.compile(r'(?i)(?:Category|Theme|Topic|Area|Issue)\s*(?:\d+)?\s*[:\-]\s*(?P<name>[^\n]+)\s*\(?(?:(?P<count>\d+)\s*(?:mentions|comments|occurrences|%|percent)?)?\)?')
+_POSITIVE_RE = re.compile(r'(?i)(?:Positive|Favorable)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)')
+_NEUTRAL_RE = re.compile(r'(?i)(?:Neutral|Balanced)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)')
+_NEGATIVE_RE = re.compile(r'(?i)(?:Negative|Critical|Unfavorable)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)')
+
+# All three sentiment percentages in one pattern, so the text is scanned once; the kind group maps to a sentiment key
+_SENTIMENT_RE = re.compile(r'(?i)(?P<kind>Positive|Favorable|Neutral|Balanced|Negative|Critical|Unfavorable)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(?P<pct>\d+)\s*(?:%|percent)')
+_SENTIMENT_KINDS = {
+    'positive': 'positive', 'favorable': 'positive',
+    'neutral': 'neutral', 'balanced': 'neutral',
+    'negative': 'negative', 'critical': 'negative', 'unfavorable': 'negative'
+}
+
+# Standard feedback categories, and a single pattern that finds the section of items for any of them
+_STANDARD_CATEGORIES = [
+    "UI/UX Issues", 
+    "Performance Problems", 
+    "Feature Requests", 
+    "Usability Concerns",
+    "Documentation Needs"
+]
+_CATEGORY_SECTION_RE = re.compile(
+    "(" + "|".join(re.escape(category) for category in _STANDARD_CATEGORIES) + r")[:\s-]*\n([\s\S]*?)(?=\n\n|\n[A-Z]|$)",
+    re.IGNORECASE
+)
+_CATEGORY_BY_LOWER = {category.lower(): category for category in _STANDARD_CATEGORIES}
+_ITEM_SPLIT_RE = re.compile(r'\n\s*[-•*]\s*|\n\s*\d+\.\s*|\n\n')
+
+@lru_cache(maxsize=1)
+def _get_sample_feedback():
+    """Import the sample feedback from direct_app.py once, or None if it cannot be imported"""
+    try:
+        from direct_app import SAMPLE_FEEDBACK
+        return SAMPLE_FEEDBACK
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=1)
+def _get_agent_classes():
+    """Import the Agent and Task classes once, on the first LLM analysis"""
+    from direct_agents.agent import Agent
+    from direct_agents.task import Task
+    return Agent, Task
+
+def _analyze_feedback(feedback_analysis_text, raw_feedback):
     """
-    Create visualizations for the feedback analysis tab
+    Run the analysis behind render_feedback_analysis_visualization
+    
+    Successful runs are cached per pair of input texts. When the LLM call fails, the regex
+    fallback is computed here, outside the cache, so the next rerun retries the LLM.
     
     Args:
         feedback_analysis_text: The feedback analysis text from the AI
-        raw_feedback: Optional raw feedback data to analyze if extraction fails
+        raw_feedback: Raw feedback data, or None
+        
+    Returns:
+        tuple: (categories, sentiment, categorized_feedback)
     """
-    # Import the sample feedback if raw_feedback is not provided
-    if not raw_feedback:
-        try:
-            # Try to import the sample feedback from direct_app.py
-            from direct_app import SAMPLE_FEEDBACK
-            raw_feedback = SAMPLE_FEEDBACK
-        except ImportError:
-            # If import fails, use None (will fall back to sample data)
-            pass
+    try:
+        return _analyze_feedback_cached(feedback_analysis_text, raw_feedback)
+    except Exception as e:
+        print(f"Error using LLM for feedback analysis: {str(e)}")
     
+    categories, sentiment = extract_feedback_data(feedback_analysis_text, raw_feedback, llm_result=(None, None))
+    categorized_feedback = extract_categorized_feedback(feedback_analysis_text, raw_feedback)
+    
+    return categories, sentiment, categorized_feedback
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _analyze_feedback_cached(feedback_analysis_text, raw_feedback):
+    """
+    Run the LLM and regex analysis for _analyze_feedback, cached per pair of input texts
+    
+    Args:
+        feedback_analysis_text: The feedback analysis text from the AI
+        raw_feedback: Raw feedback data, or None
+        
+    Returns:
+        tuple: (categories, sentiment, categorized_feedback)
+        
+    Raises:
+        Exception: Whatever the LLM call raised, so the failure is not cached
+    """
     # First try to use the LLM to analyze the raw feedback directly
     categories = None
     sentiment = None
+    llm_result = None
     
     if raw_feedback:
-        try:
-            # Use the LLM to analyze the raw feedback directly
-            llm_categories, llm_sentiment = analyze_feedback_with_llm(raw_feedback)
-            if llm_categories and sum(llm_sentiment.values()) == 100:
-                categories = llm_categories
-                sentiment = llm_sentiment
-        except Exception as e:
-            print(f"Error using LLM for feedback analysis: {str(e)}")
+        llm_result = analyze_feedback_with_llm(raw_feedback)
+        llm_categories, llm_sentiment = llm_result
+        if llm_categories and _sentiment_total(llm_sentiment) == 100:
+            categories = llm_categories
+            sentiment = llm_sentiment
     
-    # If LLM analysis failed, fall back to regex extraction
+    # If LLM analysis failed, fall back to regex extraction, handing over the LLM result instead of asking a second time
     if not categories or not sentiment:
-        categories, sentiment = extract_feedback_data(feedback_analysis_text, raw_feedback)
+        categories, sentiment = extract_feedback_data(feedback_analysis_text, raw_feedback, llm_result=llm_result)
+    
+    categorized_feedback = extract_categorized_feedback(feedback_analysis_text, raw_feedback)
+    
+    return categories, sentiment, categorized_feedback
+
+@fragment
+def render_feedback_analysis_visualization(feedback_analysis_text, raw_feedback=None, use_custom_html=False):
+    """
+    Create visualizations for the feedback analysis tab
+    
+    Args:
+        feedback_analysis_text: The feedback analysis text from the AI
+        raw_feedback: Optional raw feedback data to analyze if extraction fails
+        use_custom_html: Render the hand-built HTML bars in iframes instead of native Streamlit charts
+    """
+    # Use the sample feedback if raw_feedback is not provided (None if it cannot be imported)
+    raw_feedback = raw_feedback or _get_sample_feedback()
+    
+    # The LLM and regex analysis is cached per input, so reruns with the same texts skip it entirely
+    categories, sentiment, categorized_feedback = _analyze_feedback(feedback_analysis_text, raw_feedback)
     
     # Create a bar chart for categories
-    category_html = create_category_bars(categories)
-    components.html(category_html, height=len(categories) * 50 + 200)
+    if use_custom_html:
+        # Share one iframe between the category and sentiment bars, wrapped in a parent div with a spacer in between
+        combined_html = "".join((
+            "<div>",
+            create_category_bars(categories),
+            '<div style="height: 20px;"></div>',
+            create_sentiment_bars(sentiment),
+            "</div>"
+        ))
+        components.html(combined_html, height=len(categories) * 50 + 420)
+    else:
+        # Most mentioned first, matching the order of the custom HTML bars
+        st.markdown("<div class='section-title'>📊 Feedback Categories</div>", unsafe_allow_html=True)
+        st.bar_chart(pd.DataFrame(categories).sort_values("count", ascending=False, kind="stable").set_index("category"))
     
     # Display categorized feedback details in a table
     st.markdown("<div class='section-title'>📋 Categorized Feedback Details</div>", unsafe_allow_html=True)
-    categorized_feedback = extract_categorized_feedback(feedback_analysis_text, raw_feedback)
     display_categorized_feedback_table(categorized_feedback)
     
-    # Create a sentiment analysis visualization with increased height
-    sentiment_html = create_sentiment_bars(sentiment)
-    components.html(sentiment_html, height=200)  # Increased height for better visibility
+    # Create a sentiment analysis visualization (the custom HTML version shares the categories iframe)
+    if not use_custom_html:
+        st.markdown("<div class='section-title'>💬 Sentiment Analysis</div>", unsafe_allow_html=True)
+        st.bar_chart(pd.Series(sentiment))
 
-def extract_feedback_data(text, raw_feedback=None):
+def extract_feedback_data(text, raw_feedback=None, llm_result=None):
     """Extract categories and sentiment from feedback analysis text
     
     Args:
         text: Feedback analysis text
         raw_feedback: Optional raw feedback data to analyze if extraction fails
+        llm_result: Optional (categories, sentiment) the caller already got from analyze_feedback_with_llm for
+            raw_feedback, used instead of a second LLM call; (None, None) if that call failed
         
     Returns:
         tuple: (categories, sentiment)
     """
     # Initialize with default values
-    categories = []
     sentiment = {'positive': 0, 'neutral': 0, 'negative': 0}
     
     # Get default sentiment values
     default_sentiment = get_default_sentiment()
     default_percentages = [default_sentiment['positive'], default_sentiment['neutral'], default_sentiment['negative']]
     
-    # Try to extract categories
-    category_pattern = r'(?:Category|Theme|Topic|Area|Issue)\s*(?:\d+)?\s*[:\-]\s*([^\n]+)\s*\(?(?:(\d+)\s*(?:mentions|comments|occurrences|%|percent)?)?\)?'
-    category_matches = re.findall(category_pattern, text, re.IGNORECASE)
+    # Try to extract categories; the count group only captures digits, so a missing count means 1
+    categories = [
+        {"category": match.group('name').strip(), "count": int(match.group('count') or 1)}
+        for match in _CATEGORY_RE.finditer(text)
+    ]
     
-    for match in category_matches:
-        category_name = match[0].strip()
-        try:
-            count = int(match[1]) if len(match) > 1 and match[1].isdigit() else 1
-            categories.append({"category": category_name, "count": count})
-        except (IndexError, ValueError):
-            categories.append({"category": category_name, "count": 1})
-    
-    # Try to extract sentiment percentages
-    positive_pattern = r'(?:Positive|Favorable)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)'
-    neutral_pattern = r'(?:Neutral|Balanced)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)'
-    negative_pattern = r'(?:Negative|Critical|Unfavorable)\s*(?:sentiment|feedback)?\s*[:\-]?\s*(\d+)\s*(?:%|percent)'
-    
-    positive_match = re.search(positive_pattern, text, re.IGNORECASE)
-    neutral_match = re.search(neutral_pattern, text, re.IGNORECASE)
-    negative_match = re.search(negative_pattern, text, re.IGNORECASE)
-    
-    if positive_match and neutral_match and negative_match:
-        sentiment['positive'] = int(positive_match.group(1))
-        sentiment['neutral'] = int(neutral_match.group(1))
-        sentiment['negative'] = int(negative_match.group(1))
+    # Try to extract sentiment percentages in one pass, keeping the first percentage of each kind
+    found = {}
+    for match in _SENTIMENT_RE.finditer(text):
+        found.setdefault(_SENTIMENT_KINDS[match.group('kind').lower()], int(match.group('pct')))
+    
+    if len(found) == 3:
+        sentiment.update(found)
     else:
         sentiment['positive'] = default_percentages[0]
         sentiment['neutral'] = default_percentages[1]
         sentiment['negative'] = default_percentages[2]
     
     # If extraction failed and we have raw feedback, use LLM to analyze it
-    if (not categories or all(v == 0 for v in sentiment.values())) and raw_feedback:
+    if (not categories or _sentiment_total(sentiment) == 0) and raw_feedback:
         try:
-            # Use the LLM to analyze the raw feedback
-            llm_categories, llm_sentiment = analyze_feedback_with_llm(raw_feedback)
+            # Use the LLM to analyze the raw feedback, unless the caller already did
+            if llm_result is None:
+                llm_result = analyze_feedback_with_llm(raw_feedback)
+            llm_categories, llm_sentiment = llm_result
             
             # Use LLM results if available
             if not categories and llm_categories:
                 categories = llm_categories
             
-            if (all(v == 0 for v in sentiment.values()) or sentiment['positive'] == default_percentages[0]) and sum(llm_sentiment.values()) == 100:
+            if llm_sentiment and (_sentiment_total(sentiment) == 0 or sentiment['positive'] == default_percentages[0]) and _sentiment_total(llm_sentiment) == 100:
                 sentiment = llm_sentiment
         except Exception as e:
             print(f"Error using LLM for feedback analysis: {str(e)}")
-            # If LLM analysis fails, use default categories
-            if not categories:
-                categories = get_default_categories()
-    # If extraction failed and no raw feedback is provided, use default categories
-    elif not categories:
+    
+    # If extraction and the LLM both failed, use default categories
+    if not categories:
         categories = get_default_categories()
     
     return categories, sentiment
 
+def extract_feedback_data_batch(texts):
+    """Extract categories and sentiment from many feedback analysis texts at once
+    
+    Uses pandas' vectorized string extraction instead of a Python-level regex loop per text.
+    Unlike extract_feedback_data, there is no LLM fallback for texts where extraction fails.
+    
+    Args:
+        texts: Iterable of feedback analysis texts
+        
+    Returns:
+        pd.DataFrame: One row per text, in input order, with 'categories' and 'sentiment' columns
+    """
+    series = pd.Series(list(texts), dtype=object).fillna("")
+    
+    # Category matches for all texts, indexed by (text index, match number)
+    category_matches = series.str.extractall(_CATEGORY_RE)
+    
+    # First positive/neutral/negative percentage in each text (NaN where missing)
+    percentages = pd.DataFrame({
+        'positive': series.str.extract(_POSITIVE_RE, expand=False),
+        'neutral': series.str.extract(_NEUTRAL_RE, expand=False),
+        'negative': series.str.extract(_NEGATIVE_RE, expand=False)
+    })
+    complete = percentages.notna().all(axis=1)
+    
+    categories_by_text = {
+        index: [
+            {"category": name.strip(), "count": int(count) if isinstance(count, str) else 1}
+            for name, count in zip(group['name'], group['count'])
+        ]
+        for index, group in category_matches.groupby(level=0)
+    }
+    
+    rows = []
+    for index in series.index:
+        if complete[index]:
+            sentiment = {key: int(percentages.at[index, key]) for key in ('positive', 'neutral', 'negative')}
+        else:
+            sentiment = get_default_sentiment()
+        rows.append({
+            'categories': categories_by_text.get(index) or get_default_categories(),
+            'sentiment': sentiment
+        })
+    
+    return pd.DataFrame(rows, index=series.index, columns=['categories', 'sentiment'])
+
+def _feedback_cache_key(feedback_text):
+    """Normalize feedback text for caching, so copies that differ only in case or whitespace share one result"""
+    return " ".join(feedback_text.lower().split())
+
 def analyze_feedback_with_llm(feedback_text):
     """Use the AI agent to analyze feedback data for categories and sentiment
     
+    Results are cached per normalized feedback text, so Streamlit reruns and near-identical
+    copies of the same feedback do not repeat the agent call.
+    
     Args:
         feedback_text (str): Raw feedback data
         
     Returns:
         tuple: (categories, sentiment)
+        
+    Raises:
+        RuntimeError: If the agent call failed
     """
-    from direct_agents.agent import Agent
-    from direct_agents.task import Task
+    return _analyze_feedback_with_llm_cached(_feedback_cache_key(feedback_text), feedback_text)
+
+# Static part of the feedback analyst's task description; only the feedback text is appended per call
+_FEEDBACK_TASK_PREFIX = f"""Count how many feedback comments fall into each category (a comment can count for several) and give the positive, neutral and negative sentiment percentages, summing to 100.
+Return JSON only: {{"c": [int, int, int, int, int], "s": [positive, neutral, negative]}}
+c order: {', '.join(_STANDARD_CATEGORIES)}
+
+Feedback:
+"""
+
+# Agent.execute_task reports API failures as a reply starting with this text instead of raising
+_AGENT_ERROR_PREFIX = "Error executing task with Anthropic API"
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _analyze_feedback_with_llm_cached(cache_key, _feedback_text):
+    """Run the feedback analyst agent; st.cache_data keys on cache_key and skips hashing _feedback_text
+    
+    Raises:
+        RuntimeError: If the agent call failed, so the failure is not cached
+    """
+    feedback_text = _feedback_text
+    Agent, Task = _get_agent_classes()
     
     # Create a feedback analysis agent
     feedback_analyst = Agent(
@@ -142,116 +310,103 @@ def analyze_feedback_with_llm(feedback_text):
         verbose=False
     )
     
-    # Define the standard categories we want to use
-    standard_categories = [
-        "UI/UX Issues", 
-        "Performance Problems", 
-        "Feature Requests", 
-        "Usability Concerns", 
-        "Documentation Needs"
-    ]
-    
-    # Create a task for the agent to analyze the feedback
+    # Ask for compact JSON only: counts in _STANDARD_CATEGORIES order and three sentiment percentages
     analysis_task = Task(
-        description=f"""Analyze the following user feedback and provide:
-1. Count how many comments fall into each of these categories: {', '.join(standard_categories)}. A comment can belong to multiple categories.
-2. Calculate the sentiment percentage (positive, neutral, negative) across all comments.
-
-Format your response exactly as follows:
-
-CATEGORIES:
-UI/UX Issues: [count]
-Performance Problems: [count]
-Feature Requests: [count]
-Usability Concerns: [count]
-Documentation Needs: [count]
-
-SENTIMENT:
-Positive: [percentage]%
-Neutral: [percentage]%
-Negative: [percentage]%
-
-Here's the feedback to analyze:
-{feedback_text}""",
+        description=_FEEDBACK_TASK_PREFIX + feedback_text,
         agent=feedback_analyst,
-        expected_output="Categorized feedback counts and sentiment percentages"
+        expected_output='JSON object {"c": [5 category counts], "s": [3 sentiment percentages]}'
     )
     
     # Execute the task
     result = analysis_task.execute()
+    if result.startswith(_AGENT_ERROR_PREFIX):
+        raise RuntimeError(result)
     
-    # Parse the result to extract categories and sentiment
-    categories = []
-    sentiment = {'positive': 0, 'neutral': 0, 'negative': 0}
+    # Parse the result to extract category counts and sentiment
+    category_counts, sentiment = parse_feedback_json(result)
     
-    # Extract categories
-    category_pattern = r'([\w\s/]+):\s*(\d+)'
-    category_section = False
-    sentiment_section = False
-    
-    for line in result.split('\n'):
-        if 'CATEGORIES:' in line:
-            category_section = True
-            sentiment_section = False
-            continue
-        elif 'SENTIMENT:' in line:
-            category_section = False
-            sentiment_section = True
-            continue
-        
-        if category_section:
-            category_match = re.search(category_pattern, line)
-            if category_match:
-                category_name = category_match.group(1).strip()
-                count = int(category_match.group(2))
-                if count > 0:  # Only include categories with counts > 0
-                    categories.append({"category": category_name, "count": count})
-        
-        if sentiment_section:
-            if 'Positive:' in line:
-                match = re.search(r'Positive:\s*(\d+)%', line)
-                if match:
-                    sentiment['positive'] = int(match.group(1))
-            elif 'Neutral:' in line:
-                match = re.search(r'Neutral:\s*(\d+)%', line)
-                if match:
-                    sentiment['neutral'] = int(match.group(1))
-            elif 'Negative:' in line:
-                match = re.search(r'Negative:\s*(\d+)%', line)
-                if match:
-                    sentiment['negative'] = int(match.group(1))
-    
-    # Sort categories by count in descending order
-    categories = sorted(categories, key=lambda x: x["count"], reverse=True)
+    # Sort categories by count in descending order, building the list of dicts callers expect only here
+    categories = [
+        {"category": category, "count": count}
+        for category, count in sorted((category_counts or {}).items(), key=lambda item: item[1], reverse=True)
+    ]
     
     # If no categories were found, use default categories
     if not categories:
         categories = get_default_categories()
     
-    # If sentiment doesn't add up to 100%, use default sentiment
-    if sum(sentiment.values()) != 100:
+    # If sentiment is missing or doesn't add up to 100%, use default sentiment
+    if not sentiment or _sentiment_total(sentiment) != 100:
         sentiment = get_default_sentiment()
     
     return categories, sentiment
 
+def parse_feedback_json(result_text):
+    """Parse the compact {"c": [...], "s": [...]} JSON returned by the feedback analyst
+    
+    Args:
+        result_text (str): The text result from the LLM
+        
+    Returns:
+        tuple: (category_counts, sentiment) as dicts keyed by category and sentiment kind; either is None
+            if missing or malformed. Categories with a count of 0 are left out.
+    """
+    # Tolerate prose or code fences around the object
+    start = result_text.find('{')
+    end = result_text.rfind('}')
+    if start < 0 or end < start:
+        return None, None
+    
+    try:
+        data = json.loads(result_text[start:end + 1])
+    except json.JSONDecodeError:
+        return None, None
+    
+    if not isinstance(data, dict):
+        return None, None
+    
+    category_counts = None
+    counts = data.get('c')
+    if isinstance(counts, list) and len(counts) == len(_STANDARD_CATEGORIES) and all(isinstance(count, int) for count in counts):
+        category_counts = {category: count for category, count in zip(_STANDARD_CATEGORIES, counts) if count > 0}
+    
+    sentiment = None
+    percentages = data.get('s')
+    if isinstance(percentages, list) and len(percentages) == 3 and all(isinstance(pct, int) for pct in percentages):
+        sentiment = dict(zip(('positive', 'neutral', 'negative'), percentages))
+    
+    return category_counts, sentiment
+
+@lru_cache(maxsize=1)
 def get_default_categories():
-    """Provide default empty categories with the standard structure"""
-    return [
+    """Provide default empty categories with the standard structure
+    
+    The same tuple is returned on every call, so callers must not modify it or its dictionaries.
+    """
+    return (
         {"category": "UI/UX Issues", "count": 0},
         {"category": "Performance Problems", "count": 0},
         {"category": "Feature Requests", "count": 0},
         {"category": "Usability Concerns", "count": 0},
         {"category": "Documentation Needs", "count": 0}
-    ]
+    )
 
+@lru_cache(maxsize=1)
 def get_default_sentiment():
-    """Provide balanced default sentiment when analysis fails"""
+    """Provide balanced default sentiment when analysis fails
+    
+    The same dictionary is returned on every call, so callers must not modify it.
+    """
     return {
         'positive': 33,
         'neutral': 34,
         'negative': 33
     }
 
+def _sentiment_total(sentiment):
+    """Sum the positive, neutral and negative percentages (all are non-negative, so 0 means none were found)"""
+    return sentiment['positive'] + sentiment['neutral'] + sentiment['negative']
+
 # Sample sentiment data is now handled directly in the extraction functions
 
 def extract_categorized_feedback(feedback_analysis_text, raw_feedback=None):
@@ -265,30 +420,26 @@ def extract_categorized_feedback(feedback_analysis_text, raw_feedback=None):
         dict: Dictionary with categories as keys and lists of feedback items as values
     """
     # Standard categories we want to extract
-    standard_categories = [
-        "UI/UX Issues", 
-        "Performance Problems", 
-        "Feature Requests", 
-        "Usability Concerns",
-        "Documentation Needs"
-    ]
+    standard_categories = _STANDARD_CATEGORIES
     
     # Initialize the result dictionary
     categorized_feedback = {category: [] for category in standard_categories}
     
-    # Try to extract feedback items by category using regex patterns
+    # Find the section for every category in one pass over the text, keeping the first match per category.
+    # Each section is the category name followed by a list of items
+    section_contents = {}
+    for section_match in _CATEGORY_SECTION_RE.finditer(feedback_analysis_text):
+        category = _CATEGORY_BY_LOWER[section_match.group(1).lower()]
+        section_contents.setdefault(category, section_match.group(2))
+    
+    # Try to extract feedback items by category
     for category in standard_categories:
-        # Create a pattern to find sections related to this category
-        # This looks for the category name followed by a list of items
-        category_pattern = rf"{category}[:\s-]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)"
-        category_match = re.search(category_pattern, feedback_analysis_text, re.IGNORECASE)
-        
-        if category_match:
+        if category in section_contents:
             # Extract the content under this category
-            content = category_match.group(1).strip()
+            content = section_contents[category].strip()
             
             # Split into individual items (looking for bullet points, numbers, or new lines)
-            items = re.split(r'\n\s*[-•*]\s*|\n\s*\d+\.\s*|\n\n', content)
+            items = _ITEM_SPLIT_RE.split(content)
             
             # Clean up the items and add them to the result
             for item in items:
@@ -301,23 +452,33 @@ def extract_categorized_feedback(feedback_analysis_text, raw_feedback=None):
     if total_items < 5 and raw_feedback:
         # This is a simplified approach - in a real app, you might want to use
         # a more sophisticated method like LLM categorization of each feedback item
+        # Split raw feedback into lines or sentences once, keeping only substantial lines
+        feedback_lines = [line.strip() for line in raw_feedback.replace('. ', '\n').splitlines()]
+        feedback_lines = [line for line in feedback_lines if len(line) > 10]
+        
         for category in standard_categories:
             # Look for keywords related to each category in the raw feedback
-            keywords = get_category_keywords(category)
-            
-            # Split raw feedback into lines or sentences
-            feedback_lines = re.split(r'\n|\. ', raw_feedback)
+            keyword_re = _CATEGORY_KEYWORD_RES.get(category)
+            if keyword_re is None:
+                continue
             
             for line in feedback_lines:
-                line = line.strip()
-                if line and len(line) > 10:  # Only consider substantial lines
-                    # Check if any keyword appears in this line
-                    if any(keyword.lower() in line.lower() for keyword in keywords):
-                        if line not in categorized_feedback[category]:  # Avoid duplicates
-                            categorized_feedback[category].append(line)
+                # Check if any keyword appears in this line
+                if keyword_re.search(line):
+                    if line not in categorized_feedback[category]:  # Avoid duplicates
+                        categorized_feedback[category].append(line)
     
     return categorized_feedback
 
+# Keywords associated with each standard feedback category, built once at import
+_CATEGORY_KEYWORDS = {
+    "UI/UX Issues": ("ui", "ux", "interface", "design", "layout", "color", "button", "menu", "navigation", "dark mode", "theme"),
+    "Performance Problems": ("slow", "lag", "crash", "freeze", "performance", "speed", "loading", "memory", "battery", "resource"),
+    "Feature Requests": ("feature", "add", "implement", "include", "support", "integration", "functionality", "capability", "option"),
+    "Usability Concerns": ("usability", "difficult", "confusing", "intuitive", "learn", "understand", "workflow", "process", "steps"),
+    "Documentation Needs": ("documentation", "guide", "tutorial", "help", "example", "instruction", "explain", "unclear", "manual")
+}
+
 def get_category_keywords(category):
     """Get keywords associated with each feedback category
     
@@ -325,17 +486,21 @@ def get_category_keywords(category):
         category: The category name
         
     Returns:
-        list: List of keywords related to the category
+        tuple: Lowercase keywords related to the category
     """
-    keywords = {
-        "UI/UX Issues": ["ui", "ux", "interface", "design", "layout", "color", "button", "menu", "navigation", "dark mode", "theme"],
-        "Performance Problems": ["slow", "lag", "crash", "freeze", "performance", "speed", "loading", "memory", "battery", "resource"],
-        "Feature Requests": ["feature", "add", "implement", "include", "support", "integration", "functionality", "capability", "option"],
-        "Usability Concerns": ["usability", "difficult", "confusing", "intuitive", "learn", "understand", "workflow", "process", "steps"],
-        "Documentation Needs": ["documentation", "guide", "tutorial", "help", "example", "instruction", "explain", "unclear", "manual"]
-    }
-    
-    return keywords.get(category, [])
+    return _CATEGORY_KEYWORDS.get(category, ())
+
+# One case-insensitive keyword alternation per standard category, so each line is scanned once per category
+_CATEGORY_KEYWORD_RES = {
+    category: re.compile("|".join(re.escape(keyword) for keyword in get_category_keywords(category)), re.IGNORECASE)
+    for category in _STANDARD_CATEGORIES
+}
+
+# Card for one feedback item; the item text is escaped before it is formatted in
+_FEEDBACK_CARD_TMPL = (
+    '<div style="padding: 10px; border-left: 4px solid {color}; background-color: {color}10; '
+    'margin-bottom: 10px; border-radius: 4px;">{item}</div>'
+)
 
 def display_categorized_feedback_table(categorized_feedback):
     """Display categorized feedback in a table format
@@ -349,15 +514,6 @@ def display_categorized_feedback_table(categorized_feedback):
     categories = list(categorized_feedback.keys())
     tabs = st.tabs(categories)
     
-    # Define category colors for visual distinction
-    category_colors = {
-        "UI/UX Issues": "#42A5F5",  # Blue
-        "Performance Problems": "#FF7043",  # Orange
-        "Feature Requests": "#66BB6A",  # Green
-        "Usability Concerns": "#FFC107",  # Yellow
-        "Documentation Needs": "#9575CD"   # Purple
-    }
-    
     # Display feedback items for each category in its tab
     for i, category in enumerate(categories):
         with tabs[i]:
@@ -367,16 +523,61 @@ def display_categorized_feedback_table(categorized_feedback):
                 st.info(f"No specific {category} were identified in the feedback.")
             else:
                 # Display each feedback item as a card with the category color
-                color = category_colors.get(category, "#9E9E9E")  # Default to gray if category not found
+                color = _CATEGORY_COLORS.get(category, "#9E9E9E")  # Default to gray if category not found
                 
-                for item in items:
-                    st.markdown(f"""
-                    <div style="padding: 10px; border-left: 4px solid {color}; 
-                                background-color: {color}10; margin-bottom: 10px; 
-                                border-radius: 4px;">
-                        {item}
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Emit all cards of the category in one markdown call instead of one per item
+                card_html_parts = [_FEEDBACK_CARD_TMPL.format(color=color, item=escape(item)) for item in items]
+                st.markdown("".join(card_html_parts), unsafe_allow_html=True)
+
+# Static HTML blocks shared by the feedback chart builders
+_CATEGORY_BARS_HEADER = """
+    <div style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; padding: 20px; background-color: #f9f9f9; border-radius: 10px;">
+        <h3 style="color: #333; margin-bottom: 20px;">Feedback Categories</h3>
+    """
+
+_SENTIMENT_BARS_HEADER = '''
+    <div style="margin-top: 20px; margin-bottom: 20px;">
+        <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid #673AB7; padding-bottom: 8px;">Sentiment Analysis</h3>
+    '''
+
+# Row templates for the feedback charts; only the per-row values are formatted in at render time
+# The bars are drawn as one SVG per chart: a label row and a bar track per item, _BAR_ROW_PITCH pixels apart
+_BAR_ROW_PITCH = 50
+_BARS_SVG_OPEN = '\n        <svg width="100%" height="{height}" xmlns="http://www.w3.org/2000/svg" style="overflow: visible;">'
+_BARS_SVG_CLOSE = '\n        </svg>\n        '
+
+_BAR_ROW_TMPL = """
+            <text x="0" y="{text_y}" font-weight="500">{name}</text>
+            <text x="100%" y="{text_y}" text-anchor="end">{count} mentions</text>
+            <rect x="0" y="{bar_y}" width="100%" height="20" rx="4" fill="#E0E0E0"/>
+            <rect x="0" y="{bar_y}" width="{pct}%" height="20" rx="4" fill="{color}"/>"""
+
+_SENTIMENT_ROW_TMPL = """
+            <text x="0" y="{text_y}">{label} ({pct}%)</text>
+            <rect x="0" y="{bar_y}" width="100%" height="24" rx="12" fill="#E0E0E0"/>
+            <rect x="0" y="{bar_y}" width="{pct}%" height="24" rx="12" fill="{color}"/>"""
+
+# Colors for the standard feedback categories; anything else is drawn in gray
+_CATEGORY_COLORS = {
+    "UI/UX Issues": "#42A5F5",  # Blue
+    "Performance Problems": "#FF7043",  # Orange
+    "Feature Requests": "#66BB6A",  # Green
+    "Usability Concerns": "#FFC107",  # Yellow
+    "Documentation Needs": "#9575CD"   # Purple
+}
+
+def _compute_bar_layout(counts):
+    """
+    Compute bar widths as a percentage of the largest count
+    
+    Args:
+        counts (np.ndarray): int64 array of category counts
+        
+    Returns:
+        np.ndarray: float64 array of widths in percent
+    """
+    # Clamp to 1 so all-zero counts (the default categories) give zero widths instead of dividing by zero
+    return counts / max(counts.max(initial=0), 1) * 100
 
 def create_category_bars(categories):
     """Create bar chart for feedback categories
@@ -387,201 +588,60 @@ def create_category_bars(categories):
     Returns:
         str: HTML for the visualization
     """
-    # Sort categories by count
-    sorted_categories = sorted(categories, key=lambda x: x['count'], reverse=True)
+    # Escape the names once here so the cached builder never sees raw text
+    names = tuple(escape(c['category']) for c in categories)
+    counts = tuple(c['count'] for c in categories)
+    return _category_bars_html(names, counts)
+
+@st.cache_data(show_spinner=False)
+def _category_bars_html(names, counts):
+    """Build the category bars HTML, cached per parallel tuples of escaped category names and counts"""
+    # Sort category indices by count
+    order = sorted(range(len(counts)), key=counts.__getitem__, reverse=True)
     
     # Create a bar chart for categories
-    html = f"""
-    <div style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; padding: 20px; background-color: #f9f9f9; border-radius: 10px;">
-        <h3 style="color: #333; margin-bottom: 20px;">Feedback Categories</h3>
-    """
+    parts = [_CATEGORY_BARS_HEADER]
     
-    # Define colors for different categories
-    category_colors = {
-        "UI/UX Issues": "#42A5F5",  # Blue
-        "Performance Problems": "#FF7043",  # Orange
-        "Feature Requests": "#66BB6A",  # Green
-        "Usability Concerns": "#FFC107",  # Yellow
-        "Documentation Needs": "#9575CD"   # Purple
-    }
+    # Calculate the percentage width of each bar relative to the largest count
+    sorted_counts = [counts[i] for i in order]
+    widths = _compute_bar_layout(np.array(sorted_counts, dtype=np.int64)).tolist()
     
-    # Get the maximum count for scaling
-    max_count = max([c['count'] for c in sorted_categories]) if sorted_categories else 1
-    
-    # Create a bar for each category
-    for category in sorted_categories:
-        # Get the color for this category or use a default gray
-        color = category_colors.get(category['category'], "#9E9E9E")
-        
-        # Calculate the percentage width based on the count
-        width_percent = (category['count'] / max_count) * 100
+    # Create a bar for each category inside a single SVG
+    parts.append(_BARS_SVG_OPEN.format(height=len(order) * _BAR_ROW_PITCH))
+    for j, i in enumerate(order):
+        name = names[i]
+        top = j * _BAR_ROW_PITCH
         
-        html += f"""
-        <div style="margin-bottom: 15px;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                <div style="font-weight: 500;">{category['category']}</div>
-                <div>{category['count']} mentions</div>
-            </div>
-            <div style="height: 20px; background-color: #E0E0E0; border-radius: 4px; overflow: hidden;">
-                <div style="width: {width_percent}%; height: 100%; background-color: {color};"></div>
-            </div>
-        </div>
-        """
-    
-    html += "</div>"
-    
-    return html
+        # Get the color for this category or use a default gray
+        parts.append(_BAR_ROW_TMPL.format(
+            name=name, count=sorted_counts[j], pct=widths[j], color=_CATEGORY_COLORS.get(name, "#9E9E9E"),
+            text_y=top + 15, bar_y=top + 22
+        ))
+    parts.append(_BARS_SVG_CLOSE)
+    
+    parts.append("</div>")
+    
+    return "".join(parts)
 
 def create_sentiment_bars(sentiment):
     """Create sentiment analysis bars"""
-    html = '''
-    <div style="margin-top: 20px; margin-bottom: 20px;">
-        <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid #673AB7; padding-bottom: 8px;">Sentiment Analysis</h3>
-    '''
-    
-    # Positive
-    html += f'''
-    <div style="display: flex; align-items: center; margin-top: 15px;">
-        <div style="width: 120px; text-align: right; padding-right: 10px;">Positive ({sentiment['positive']}%)</div>
-        <div style="flex-grow: 1; background-color: #E0E0E0; height: 24px; border-radius: 12px; overflow: hidden;">
-            <div style="width: {sentiment['positive']}%; height: 100%; background-color: #4CAF50;"></div>
-        </div>
-    </div>
-    '''
-    
-    # Neutral
-    html += f'''
-    <div style="display: flex; align-items: center; margin-top: 10px;">
-        <div style="width: 120px; text-align: right; padding-right: 10px;">Neutral ({sentiment['neutral']}%)</div>
-        <div style="flex-grow: 1; background-color: #E0E0E0; height: 24px; border-radius: 12px; overflow: hidden;">
-            <div style="width: {sentiment['neutral']}%; height: 100%; background-color: #2196F3;"></div>
-        </div>
-    </div>
-    '''
-    
-    # Negative
-    html += f'''
-    <div style="display: flex; align-items: center; margin-top: 10px;">
-        <div style="width: 120px; text-align: right; padding-right: 10px;">Negative ({sentiment['negative']}%)</div>
-        <div style="flex-grow: 1; background-color: #E0E0E0; height: 24px; border-radius: 12px; overflow: hidden;">
-            <div style="width: {sentiment['negative']}%; height: 100%; background-color: #F44336;"></div>
-        </div>
-    </div>
-    '''
-    
-    html += "</div>"
-    
-    return html
+    return _sentiment_bars_html(sentiment['positive'], sentiment['neutral'], sentiment['negative'])
 
-def create_feedback_trends_graph(categories, sentiment):
-    """Create a feedback trends graph visualization"""
-    # Create a scatter plot showing category count vs sentiment impact
-    html = '''
-    <div style="margin-top: 30px; margin-bottom: 30px;">
-        <h3 style="margin-top: 0; color: #333; border-bottom: 2px solid #673AB7; padding-bottom: 8px;">Feedback Impact Analysis</h3>
-        
-        <div style="position: relative; width: 100%; height: 300px; margin-top: 20px; border: 1px solid #ddd; border-radius: 8px; padding: 10px;">
-            <!-- Y-axis label -->
-            <div style="position: absolute; left: -40px; top: 50%; transform: translateY(-50%) rotate(-90deg); font-weight: 500; color: #555;">Impact Severity</div>
-            
-            <!-- X-axis label -->
-            <div style="position: absolute; bottom: -30px; left: 50%; transform: translateX(-50%); font-weight: 500; color: #555;">Mention Frequency</div>
-            
-            <!-- Y-axis -->
-            <div style="position: absolute; left: 50px; top: 20px; bottom: 50px; width: 1px; background-color: #aaa;"></div>
-            
-            <!-- X-axis -->
-            <div style="position: absolute; left: 50px; right: 20px; bottom: 50px; height: 1px; background-color: #aaa;"></div>
-            
-            <!-- Y-axis ticks -->
-            <div style="position: absolute; left: 45px; top: 20px; width: 10px; height: 1px; background-color: #aaa;"></div>
-            <div style="position: absolute; left: 35px; top: 20px; font-size: 12px; color: #777;">High</div>
-            
-            <div style="position: absolute; left: 45px; top: 50%; width: 10px; height: 1px; background-color: #aaa;"></div>
-            <div style="position: absolute; left: 35px; top: calc(50% - 10px); font-size: 12px; color: #777;">Med</div>
-            
-            <div style="position: absolute; left: 45px; bottom: 50px; width: 10px; height: 1px; background-color: #aaa;"></div>
-            <div style="position: absolute; left: 35px; bottom: 40px; font-size: 12px; color: #777;">Low</div>
-            
-            <!-- X-axis ticks -->
-            <div style="position: absolute; left: 50px; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
-            <div style="position: absolute; left: 45px; bottom: 30px; font-size: 12px; color: #777;">0</div>
-            
-            <div style="position: absolute; left: 50%; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
-            <div style="position: absolute; left: calc(50% - 5px); bottom: 30px; font-size: 12px; color: #777;">5</div>
-            
-            <div style="position: absolute; right: 20px; bottom: 45px; width: 1px; height: 10px; background-color: #aaa;"></div>
-            <div style="position: absolute; right: 15px; bottom: 30px; font-size: 12px; color: #777;">10</div>
-    '''
-    
-    # Calculate the available width and height for plotting
-    plot_width = "calc(100% - 70px)"
-    plot_height = "calc(100% - 70px)"
-    
-    # Calculate max count for normalization
-    max_count = max([c["count"] for c in categories]) if categories else 10
-    
-    # Add data points (bubbles)
-    for i, category in enumerate(categories):
-        # Calculate position based on count and sentiment impact
-        # X-position based on count
-        x_percent = (category["count"] / max_count) * 100
-        
-        # Y-position based on sentiment impact (using negative sentiment percentage as a proxy for severity)
-        # Higher negative sentiment means higher on the y-axis (more severe)
-        severity = sentiment['negative'] / 100
-        y_percent = 100 - (severity * 100)
-        
-        # Bubble size based on total mentions
-        bubble_size = 20 + (category["count"] * 5)
-        
-        # Determine color based on sentiment
-        if sentiment['positive'] > sentiment['negative'] + 10:
-            color = "#4CAF50"  # Green for positive
-        elif sentiment['negative'] > sentiment['positive'] + 10:
-            color = "#F44336"  # Red for negative
-        else:
-            color = "#2196F3"  # Blue for neutral
-        
-        # Add the bubble
-        html += f'''
-        <div style="position: absolute; left: calc(50px + {x_percent}% * {plot_width} / 100); top: calc(20px + {y_percent}% * {plot_height} / 100); transform: translate(-50%, -50%); width: {bubble_size}px; height: {bubble_size}px; background-color: {color}80; border: 2px solid {color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: #333; font-weight: 500; font-size: 12px;" title="{category['category']} ({category['count']} mentions)">
-            {i+1}
-        </div>
-        '''
-    
-    # Add legend
-    html += '''
-        <div style="position: absolute; top: 20px; right: 20px; background-color: white; border: 1px solid #ddd; border-radius: 4px; padding: 10px;">
-            <div style="font-weight: 500; margin-bottom: 5px;">Legend</div>
-    '''
-    
-    # Add legend items for each category
-    for i, category in enumerate(categories):
-        html += f'''
-            <div style="display: flex; align-items: center; margin-bottom: 5px;">
-                <div style="width: 15px; height: 15px; border-radius: 50%; background-color: {"#4CAF50" if sentiment['positive'] > sentiment['negative'] + 10 else "#F44336" if sentiment['negative'] > sentiment['positive'] + 10 else "#2196F3"}; margin-right: 5px; display: flex; align-items: center; justify-content: center; color: white; font-size: 10px;">{i+1}</div>
-                <div style="font-size: 12px;">{category["category"]}</div>
-            </div>
-        '''
-    
-    html += '''
-        </div>
-    </div>
-    '''
+@st.cache_data(show_spinner=False)
+def _sentiment_bars_html(positive, neutral, negative):
+    """Build the sentiment bars HTML, cached per set of percentages"""
+    rows = (
+        ("Positive", positive, SENTIMENT_COLORS["positive"]),
+        ("Neutral", neutral, SENTIMENT_COLORS["neutral"]),
+        ("Negative", negative, SENTIMENT_COLORS["negative"])
+    )
     
-    # Add a quadrant analysis section
-    html += '''
-    <div style="margin-top: 20px;">
-        <h4 style="margin-top: 0; color: #555;">Insight:</h4>
-        <p style="margin-top: 5px; color: #666;">
-            The graph plots feedback categories by mention frequency (x-axis) and impact severity (y-axis). 
-            Items in the upper-right quadrant represent high-priority issues that are both frequently mentioned and have high impact.
-            Bubble color indicates sentiment (green = positive, blue = neutral, red = negative).
-        </p>
-    </div>
-    '''
+    parts = [_SENTIMENT_BARS_HEADER, _BARS_SVG_OPEN.format(height=len(rows) * _BAR_ROW_PITCH + 15)]
+    for j, (label, pct, color) in enumerate(rows):
+        top = 15 + j * _BAR_ROW_PITCH
+        parts.append(_SENTIMENT_ROW_TMPL.format(label=label, pct=pct, color=color, text_y=top + 15, bar_y=top + 22))
+    parts.append(_BARS_SVG_CLOSE)
     
-    html += '</div>'
+    parts.append("</div>")
     
-    return html
+    return "".join(parts)
@@ -2,17 +2,93 @@
 Sprint plan extraction module for Project Evolution Agents.
 Uses LLM to extract structured sprint plan data from sprint plan text.
 """
+import os
 import re
+from functools import lru_cache
+from html import escape
 from direct_agents.agent import Agent
 from direct_agents.task import Task
 import streamlit.components.v1 as components
 import plotly.graph_objects as go
 import streamlit as st
 
+# Bump when the extraction prompt or the parsing of its reply changes, so results cached for the old format are not reused
+_SPRINT_PROMPT_VERSION = "v2"
+
+# A sprint plan that already starts like the agent's reply ("SPRINT 1:" then "Duration:")
+_STRUCTURED_PLAN_RE = re.compile(r'\s*SPRINT\s+\d+\s*:[^\S\n]*\n\s*(?i:duration)\s*:')
+
+# Patterns for the priority focus and the regex fallback, compiled once rather than per call and per sprint section
+_PRIORITY_ADJUSTMENT_RE = re.compile(r"PRIORITY ADJUSTMENT:\s*(.+?)(?:\n|$)")
+_SPRINT_HEADING_RE = re.compile(r'sprint\s+(\d+)', re.IGNORECASE)
+_DURATION_RE = re.compile(r'(\d+)\s*(?:week|wk)s?', re.IGNORECASE)
+_FEATURES_RE = re.compile(r'features?[:\-]([^\n]+)', re.IGNORECASE)
+_BULLET_RE = re.compile(r'(?:^|\n)(?:\*|\-|\d+\.)\s*([^\n]+)')
+_GOALS_RE = re.compile(r'goals?[:\-]([^\n]+)', re.IGNORECASE)
+_DEPENDENCIES_RE = re.compile(r'dependenc(?:y|ies)[:\-]([^\n]+)', re.IGNORECASE)
+_NUMBERED_SECTION_RE = re.compile(r'(?:^|\n)(\d+)[\.:\)]\s*([^\n]+)')
+
+# One line of the sprint planner's reply, with surrounding whitespace: a SPRINT header, a "key: value" pair
+# for one of the keys in _SPRINT_FIELD_HANDLERS (any case) or a blank line. Other lines, including other keys,
+# are skipped by the regex engine, so only known keys reach Python.
+_RESULT_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:(?P<sprint>SPRINT[^\n]*?)'
+    r'|(?P<key>(?i:duration|features|goals|dependencies|priority features))[^\S\n]*:(?P<value>[^\n]*?)'
+    r'|(?P<blank>))[^\S\n]*$',
+    re.MULTILINE
+)
+
+# Agent.execute_task reports API failures as a reply starting with this text instead of raising
+_AGENT_ERROR_PREFIX = "Error executing task with Anthropic API"
+
+def _build_sprint_task_prefix(with_priority):
+    """Build the static start of the sprint extraction task, with or without the priority features line"""
+    # Format template for one sprint, asking for the priority features line only if there is a priority focus
+    sprint_template = """
+SPRINT {number}:
+Duration: [number] weeks
+Features: [comma-separated list of features]
+Goals: [main goals/focus]
+Dependencies: [dependencies or blockers, or "None" if none]"""
+    if with_priority:
+        sprint_template += "\nPriority Features: [list features that align with user priority]"
+    
+    return """Extract structured sprint plan data from the following text.
+For each sprint mentioned, identify:
+1. Sprint number
+2. Duration in weeks
+3. Features planned for the sprint
+4. Main goals/focus of the sprint
+5. Dependencies or blockers
+
+Format your response exactly as follows:""" + sprint_template.format(number=1) + "\n" + sprint_template.format(number=2) + """
+
+And so on for all sprints."""
+
+# Task description prefixes, indexed by whether there is a user priority focus
+_SPRINT_TASK_PREFIXES = (_build_sprint_task_prefix(False), _build_sprint_task_prefix(True))
+
+# Appended after the prefix when there is a user priority focus
+_SPRINT_PRIORITY_INSTRUCTION = "\n\nIMPORTANT: The user has requested to {focus}. For each sprint, also indicate which features align with this priority focus by marking them with an asterisk (*) in the feature list."
+
+@lru_cache(maxsize=1)
+def _get_sprint_extractor(api_key):
+    """Reuse one sprint plan extraction agent per API key; its role, goal and backstory never change"""
+    return Agent(
+        role="Sprint Planner",
+        goal="Extract structured sprint plan data",
+        backstory="You are an expert in analyzing sprint plans and extracting structured data about feature scheduling.",
+        verbose=False,
+        anthropic_api_key=api_key
+    )
+
 def extract_sprint_plan_with_llm(sprint_plan_text, user_priority_focus=None):
     """
     Use the AI agent to extract structured sprint plan data
     
+    Results are cached on disk per sprint plan text, priority focus and prompt version, so reruns
+    and app restarts with the same sprint plan skip the agent call.
+    
     Args:
         sprint_plan_text (str): Raw sprint plan text from the AI
         user_priority_focus (str, optional): User's priority focus from collaboration step
@@ -22,81 +98,48 @@ def extract_sprint_plan_with_llm(sprint_plan_text, user_priority_focus=None):
     """
     # Extract user priority focus if present in the text but not provided as parameter
     if not user_priority_focus and isinstance(sprint_plan_text, str):
-        priority_match = re.search(r"PRIORITY ADJUSTMENT:\s*(.+?)(?:\n|$)", sprint_plan_text)
+        priority_match = _PRIORITY_ADJUSTMENT_RE.search(sprint_plan_text)
         if priority_match:
             user_priority_focus = priority_match.group(1).strip()
     
-    # Create a sprint plan extraction agent
-    sprint_extractor = Agent(
-        role="Sprint Planner",
-        goal="Extract structured sprint plan data",
-        backstory="You are an expert in analyzing sprint plans and extracting structured data about feature scheduling.",
-        verbose=False
-    )
-    
-    # Adjust the task description based on whether there's a user priority focus
-    priority_instruction = ""
-    if user_priority_focus:
-        priority_instruction = "\n\nIMPORTANT: The user has requested to " + user_priority_focus + ". For each sprint, also indicate which features align with this priority focus by marking them with an asterisk (*) in the feature list."
-    
-    # Prepare the format template based on user priority focus
-    format_template = """
-SPRINT 1:
-Duration: [number] weeks
-Features: [comma-separated list of features]
-Goals: [main goals/focus]
-Dependencies: [dependencies or blockers, or "None" if none]"""
-    
-    # Add priority features line if user priority focus is specified
-    if user_priority_focus:
-        format_template += "\nPriority Features: [list features that align with user priority]"
-    
-    # Create the second sprint template
-    sprint2_template = """
-
-SPRINT 2:
-Duration: [number] weeks
-Features: [comma-separated list of features]
-Goals: [main goals/focus]
-Dependencies: [dependencies or blockers, or "None" if none]"""
-    
-    # Add priority features line for second sprint if needed
-    if user_priority_focus:
-        sprint2_template += "\nPriority Features: [list features that align with user priority]"
-    
-    # Create the task description
-    task_description = """Extract structured sprint plan data from the following text.
-For each sprint mentioned, identify:
-1. Sprint number
-2. Duration in weeks
-3. Features planned for the sprint
-4. Main goals/focus of the sprint
-5. Dependencies or blockers"""
-    
-    # Add priority instruction if needed
-    task_description += priority_instruction
-    
-    # Add format instructions
-    task_description += """
-
-Format your response exactly as follows:"""
-    
-    # Add format template
-    task_description += format_template
+    # Text already in the agent's reply format is parsed directly, without an LLM round-trip
+    if isinstance(sprint_plan_text, str) and _STRUCTURED_PLAN_RE.match(sprint_plan_text):
+        return _parse_sprint_plan_result(sprint_plan_text, sprint_plan_text, user_priority_focus)
     
-    # Add second sprint template
-    task_description += sprint2_template
-    
-    # Add final instructions and sprint plan text
-    task_description += """
-
-And so on for all sprints.
+    try:
+        return _extract_sprint_plan_cached(sprint_plan_text, user_priority_focus, _SPRINT_PROMPT_VERSION)
+    except RuntimeError:
+        # The agent call failed; fall back to regex extraction without caching the failure
+        return _parse_sprint_plan_result("", sprint_plan_text, user_priority_focus)
 
-Here's the sprint plan text to analyze:
-"""
+@st.cache_data(show_spinner=False, persist="disk")
+def _extract_sprint_plan_cached(sprint_plan_text, user_priority_focus, prompt_version):
+    """
+    Run the sprint planner agent and parse its reply, cached on disk per argument values
     
-    # Add the actual sprint plan text
-    task_description += sprint_plan_text
+    Args:
+        sprint_plan_text (str): Raw sprint plan text from the AI
+        user_priority_focus (str or None): User's priority focus
+        prompt_version (str): _SPRINT_PROMPT_VERSION; only part of the cache key
+        
+    Returns:
+        dict: Dictionary with sprint plan data including sprints, features, and timeline
+        
+    Raises:
+        RuntimeError: If the agent call failed, so the failure is not cached
+    """
+    # Reuse the sprint plan extraction agent, keyed on the current key so a sidebar change is picked up
+    sprint_extractor = _get_sprint_extractor(os.getenv("ANTHROPIC_API_KEY"))
+    
+    # Static instructions come first and only the priority instruction and sprint plan text vary, so the
+    # prompt is a stable prefix plus a short tail, joined in one step
+    priority_instruction = _SPRINT_PRIORITY_INSTRUCTION.format(focus=user_priority_focus) if user_priority_focus else ""
+    task_description = "".join((
+        _SPRINT_TASK_PREFIXES[bool(user_priority_focus)],
+        priority_instruction,
+        "\n\nHere's the sprint plan text to analyze:\n",
+        sprint_plan_text
+    ))
     
     # Create a task for the agent to extract sprint plan data
     extraction_task = Task(
@@ -107,7 +150,68 @@ Here's the sprint plan text to analyze:
     
     # Execute the task
     result = extraction_task.execute()
+    if result.startswith(_AGENT_ERROR_PREFIX):
+        raise RuntimeError(result)
     
+    return _parse_sprint_plan_result(result, sprint_plan_text, user_priority_focus)
+
+def _set_sprint_duration(sprint, value, has_priority_focus):
+    """Store the number at the start of a Duration value, defaulting to 2 weeks"""
+    try:
+        sprint['duration'] = int(value.split()[0])  # Extract just the number
+    except (ValueError, IndexError):
+        sprint['duration'] = 2  # Default to 2 weeks
+
+def _set_sprint_features(sprint, value, has_priority_focus):
+    """Store the features of a Features value, collecting the ones marked with * as priority features"""
+    # Priority indicators (*) only mean something with a priority focus
+    features = [f.strip() for f in value.split(',')]
+    priority_features = []
+    
+    if has_priority_focus:
+        # Strip the marker from priority features and collect them
+        priority_features = [feature[1:].strip() for feature in features if feature.startswith('*')]
+        if priority_features:
+            features = [feature[1:].strip() if feature.startswith('*') else feature for feature in features]
+    
+    sprint['features'] = features
+    if has_priority_focus:
+        sprint['priority_features'] = priority_features
+
+def _set_sprint_goals(sprint, value, has_priority_focus):
+    """Store a Goals value"""
+    sprint['goals'] = value
+
+def _set_sprint_dependencies(sprint, value, has_priority_focus):
+    """Store a Dependencies value"""
+    sprint['dependencies'] = value
+
+def _set_sprint_priority_features(sprint, value, has_priority_focus):
+    """Store a Priority Features value, which only applies with a priority focus"""
+    if has_priority_focus:
+        sprint['priority_features'] = [f.strip() for f in value.split(',')]
+
+# Handlers for the lowercased keys of the sprint planner's "key: value" lines
+_SPRINT_FIELD_HANDLERS = {
+    'duration': _set_sprint_duration,
+    'features': _set_sprint_features,
+    'goals': _set_sprint_goals,
+    'dependencies': _set_sprint_dependencies,
+    'priority features': _set_sprint_priority_features
+}
+
+def _parse_sprint_plan_result(result, sprint_plan_text, user_priority_focus):
+    """
+    Parse the sprint planner's reply, falling back to regex extraction on the sprint plan text
+    
+    Args:
+        result (str): The agent's reply, or an empty string if there is none
+        sprint_plan_text (str): Raw sprint plan text from the AI
+        user_priority_focus (str or None): User's priority focus
+        
+    Returns:
+        dict: Dictionary with sprint plan data including sprints, features, and timeline
+    """
     # Parse the result to extract sprint plan data
     sprints = []
     current_sprint = {}
@@ -115,18 +219,19 @@ Here's the sprint plan text to analyze:
     # Check if we have user priority focus
     has_priority_focus = user_priority_focus is not None
     
-    for line in result.split('\n'):
-        line = line.strip()
+    # One scan over the reply: each match is a SPRINT header, a "key: value" line or a blank line
+    for match in _RESULT_LINE_RE.finditer(result):
+        kind = match.lastgroup
         
         # Check for new sprint
-        if line.startswith('SPRINT') or (not line and current_sprint and 'number' in current_sprint):
+        if kind == 'sprint' or (kind == 'blank' and current_sprint and 'number' in current_sprint):
             if current_sprint and 'number' in current_sprint:
                 sprints.append(current_sprint)
                 current_sprint = {}
             
-            if line.startswith('SPRINT'):
+            if kind == 'sprint':
                 try:
-                    sprint_number = int(line.split()[1].strip(':'))
+                    sprint_number = int(match.group('sprint').split()[1].strip(':'))
                     current_sprint['number'] = sprint_number
                 except (IndexError, ValueError):
                     current_sprint['number'] = len(sprints) + 1
@@ -134,39 +239,14 @@ Here's the sprint plan text to analyze:
             continue
             
         # Extract sprint properties
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip().lower()
-            value = value.strip()
+        if kind == 'value':
+            key = match.group('key').lower()
+            value = match.group('value').strip()
             
-            if key == 'duration':
-                try:
-                    current_sprint['duration'] = int(value.split()[0])  # Extract just the number
-                except (ValueError, IndexError):
-                    current_sprint['duration'] = 2  # Default to 2 weeks
-            elif key == 'features':
-                # Process features and check for priority indicators (*)
-                features = []
-                priority_features = []
-                
-                for feature in [f.strip() for f in value.split(',')]:
-                    if feature.startswith('*') and has_priority_focus:
-                        # This is a priority feature
-                        clean_feature = feature[1:].strip()
-                        features.append(clean_feature)
-                        priority_features.append(clean_feature)
-                    else:
-                        features.append(feature)
-                
-                current_sprint['features'] = features
-                if has_priority_focus:
-                    current_sprint['priority_features'] = priority_features
-            elif key == 'goals':
-                current_sprint['goals'] = value
-            elif key == 'dependencies':
-                current_sprint['dependencies'] = value
-            elif key == 'priority features' and has_priority_focus:
-                current_sprint['priority_features'] = [f.strip() for f in value.split(',')]
+            # Dispatch on the key
+            handler = _SPRINT_FIELD_HANDLERS.get(key)
+            if handler:
+                handler(current_sprint, value, has_priority_focus)
     
     # Add the last sprint if it exists
     if current_sprint and 'number' in current_sprint:
@@ -185,22 +265,18 @@ Here's the sprint plan text to analyze:
     if not sprints:
         sprints = extract_sprint_plan_with_regex(sprint_plan_text)
     
-    # Calculate total duration
-    total_duration = sum(sprint.get('duration', 2) for sprint in sprints)
-    
-    # Count features per sprint
-    feature_counts = [len(sprint.get('features', [])) for sprint in sprints]
-    
-    # Collect all features
-    all_features = []
+    # Calculate total duration and count features per sprint in one pass
+    total_duration = 0
+    feature_counts = []
     for sprint in sprints:
-        all_features.extend(sprint.get('features', []))
+        total_duration += sprint.get('duration', 2)
+        feature_counts.append(len(sprint.get('features', ())))
     
     return {
         'sprints': sprints,
         'total_duration': total_duration,
         'feature_counts': feature_counts,
-        'total_features': len(all_features)
+        'total_features': sum(feature_counts)
     }
 
 def extract_sprint_plan_with_regex(sprint_plan_text):
@@ -215,61 +291,59 @@ def extract_sprint_plan_with_regex(sprint_plan_text):
     """
     sprints = []
     
-    # Try to find sprint sections
-    sprint_sections = re.split(r'sprint\s+(\d+)', sprint_plan_text, flags=re.IGNORECASE)
-    
-    if len(sprint_sections) > 1:
-        # First element is text before first sprint, skip it
-        for i in range(1, len(sprint_sections), 2):
-            if i + 1 < len(sprint_sections):
-                sprint_number = int(sprint_sections[i])
-                sprint_content = sprint_sections[i + 1]
-                
-                # Default values
-                duration = 2
-                features = []
-                goals = "Complete planned features"
-                dependencies = "None"
-                
-                # Extract duration
-                duration_match = re.search(r'(\d+)\s*(?:week|wk)s?', sprint_content, re.IGNORECASE)
-                if duration_match:
-                    try:
-                        duration = int(duration_match.group(1))
-                    except ValueError:
-                        pass
-                
-                # Extract features
-                features_match = re.search(r'features?[:\-]([^\n]+)', sprint_content, re.IGNORECASE)
-                if features_match:
-                    features = [f.strip() for f in features_match.group(1).split(',')]
-                else:
-                    # Try to find bullet points or numbered lists
-                    feature_items = re.findall(r'(?:^|\n)(?:\*|\-|\d+\.)\s*([^\n]+)', sprint_content)
-                    features = [f.strip() for f in feature_items]
-                
-                # Extract goals
-                goals_match = re.search(r'goals?[:\-]([^\n]+)', sprint_content, re.IGNORECASE)
-                if goals_match:
-                    goals = goals_match.group(1).strip()
-                
-                # Extract dependencies
-                dependencies_match = re.search(r'dependenc(?:y|ies)[:\-]([^\n]+)', sprint_content, re.IGNORECASE)
-                if dependencies_match:
-                    dependencies = dependencies_match.group(1).strip()
-                
-                sprints.append({
-                    'number': sprint_number,
-                    'duration': duration,
-                    'features': features,
-                    'goals': goals,
-                    'dependencies': dependencies
-                })
+    # Find each sprint heading; its content runs up to the next heading
+    sprint_matches = list(_SPRINT_HEADING_RE.finditer(sprint_plan_text))
+    
+    for index, sprint_match in enumerate(sprint_matches):
+        sprint_number = int(sprint_match.group(1))
+        content_end = sprint_matches[index + 1].start() if index + 1 < len(sprint_matches) else len(sprint_plan_text)
+        sprint_content = sprint_plan_text[sprint_match.end():content_end]
+        
+        # Default values
+        duration = 2
+        features = []
+        goals = "Complete planned features"
+        dependencies = "None"
+        
+        # Extract duration
+        duration_match = _DURATION_RE.search(sprint_content)
+        if duration_match:
+            try:
+                duration = int(duration_match.group(1))
+            except ValueError:
+                pass
+        
+        # Extract features
+        features_match = _FEATURES_RE.search(sprint_content)
+        if features_match:
+            features = [f.strip() for f in features_match.group(1).split(',')]
+        else:
+            # Try to find bullet points or numbered lists
+            feature_items = _BULLET_RE.findall(sprint_content)
+            features = [f.strip() for f in feature_items]
+        
+        # Extract goals
+        goals_match = _GOALS_RE.search(sprint_content)
+        if goals_match:
+            goals = goals_match.group(1).strip()
+        
+        # Extract dependencies
+        dependencies_match = _DEPENDENCIES_RE.search(sprint_content)
+        if dependencies_match:
+            dependencies = dependencies_match.group(1).strip()
+        
+        sprints.append({
+            'number': sprint_number,
+            'duration': duration,
+            'features': features,
+            'goals': goals,
+            'dependencies': dependencies
+        })
     
     # If no sprints found, try another approach
     if not sprints:
         # Look for numbered sections that might be sprints
-        sprint_matches = re.finditer(r'(?:^|\n)(\d+)[\.:\)]\s*([^\n]+)', sprint_plan_text)
+        sprint_matches = _NUMBERED_SECTION_RE.finditer(sprint_plan_text)
         
         for match in sprint_matches:
             sprint_number = int(match.group(1))
@@ -305,30 +379,35 @@ def render_sprint_plan(sprint_plan_data):
 
 def render_sprint_timeline(sprints):
     """Render a timeline visualization for sprints"""
-    # Create a Gantt chart
-    fig = go.Figure()
-    
-    # Calculate start and end dates for each sprint
-    current_week = 0
+    # Collect one bar per sprint, so the chart is a single trace
+    durations = []
+    labels = []
+    hover_texts = []
     for sprint in sprints:
         sprint_number = sprint.get('number', 0)
         duration = sprint.get('duration', 2)
         
-        # Add a task for the sprint
-        fig.add_trace(go.Bar(
-            x=[duration],
-            y=[f"Sprint {sprint_number}"],
-            orientation='h',
-            marker=dict(
-                color='#673AB7',
-                line=dict(color='rgba(0,0,0,0)', width=3)
-            ),
-            hoverinfo='text',
-            hovertext=f"Sprint {sprint_number}: {duration} weeks<br>Features: {', '.join(sprint.get('features', [])[:3])}{'...' if len(sprint.get('features', [])) > 3 else ''}",
-            name=f"Sprint {sprint_number}"
-        ))
+        # Preview the first three features in the hover text
+        features = sprint.get('features', [])
+        feature_preview = ', '.join(features[:3])
+        more_features = '...' if len(features) > 3 else ''
         
-        current_week += duration
+        durations.append(duration)
+        labels.append(f"Sprint {sprint_number}")
+        hover_texts.append(f"Sprint {sprint_number}: {duration} weeks<br>Features: {feature_preview}{more_features}")
+    
+    # Create a Gantt chart
+    fig = go.Figure(go.Bar(
+        x=durations,
+        y=labels,
+        orientation='h',
+        marker=dict(
+            color='#673AB7',
+            line=dict(color='rgba(0,0,0,0)', width=3)
+        ),
+        hoverinfo='text',
+        hovertext=hover_texts
+    ))
     
     # Update layout
     fig.update_layout(
@@ -351,23 +430,16 @@ def render_sprint_timeline(sprints):
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
 
-def render_feature_distribution(feature_counts):
-    """Render a bar chart for feature distribution across sprints"""
-    # Create HTML for feature distribution
-    html = '''
+# Static HTML and per-row templates for the sprint plan panels; only the row values are formatted in
+_FEATURE_DISTRIBUTION_HEADER = '''
     <div style="margin: 20px 0; padding: 15px; background-color: #f5f5f5; border-radius: 8px;">
         <h3 style="margin-top: 0; color: #333;">Features per Sprint</h3>
     '''
-    
-    # Add bars for each sprint
-    for i, count in enumerate(feature_counts):
-        # Calculate percentage for bar width (max 100%)
-        percentage = min(count * 10, 100)  # Assuming max 10 features per sprint
-        
-        html += f'''
+
+_FEATURE_DISTRIBUTION_ROW_TMPL = '''
         <div style="margin-bottom: 15px;">
             <div style="display: flex; align-items: center;">
-                <div style="width: 80px; text-align: right; padding-right: 10px;">Sprint {i+1}</div>
+                <div style="width: 80px; text-align: right; padding-right: 10px;">Sprint {number}</div>
                 <div style="flex-grow: 1; background-color: #E0E0E0; height: 24px; border-radius: 12px; overflow: hidden;">
                     <div style="width: {percentage}%; height: 100%; background-color: #673AB7;"></div>
                 </div>
@@ -375,27 +447,12 @@ def render_feature_distribution(feature_counts):
             </div>
         </div>
         '''
-    
-    html += '</div>'
-    
-    # Display the HTML
-    components.html(html, height=100 + len(feature_counts) * 30)
 
-def render_sprint_details(sprints):
-    """Render detailed information for each sprint"""
-    # Create HTML for sprint details
-    html = '''
+_SPRINT_DETAILS_HEADER = '''
     <div style="margin: 20px 0;">
     '''
-    
-    for sprint in sprints:
-        sprint_number = sprint.get('number', 0)
-        duration = sprint.get('duration', 2)
-        features = sprint.get('features', [])
-        goals = sprint.get('goals', "Complete planned features")
-        dependencies = sprint.get('dependencies', "None")
-        
-        html += f'''
+
+_SPRINT_DETAIL_OPEN_TMPL = '''
         <div style="margin-bottom: 20px; padding: 15px; background-color: #f5f5f5; border-radius: 8px; border-left: 5px solid #673AB7;">
             <h3 style="margin-top: 0; color: #333;">Sprint {sprint_number} ({duration} weeks)</h3>
             
@@ -408,11 +465,8 @@ def render_sprint_details(sprints):
                 <div style="font-weight: bold; color: #555;">Features:</div>
                 <ul style="margin-top: 5px; padding-left: 25px;">
         '''
-        
-        for feature in features:
-            html += f'<li>{feature}</li>'
-        
-        html += f'''
+
+_SPRINT_DETAIL_CLOSE_TMPL = '''
                 </ul>
             </div>
             
@@ -422,8 +476,60 @@ def render_sprint_details(sprints):
             </div>
         </div>
         '''
+
+def render_feature_distribution(feature_counts):
+    """Render a bar chart for feature distribution across sprints"""
+    # Create HTML for feature distribution
+    parts = [_FEATURE_DISTRIBUTION_HEADER]
+    
+    # Add bars for each sprint
+    for i, count in enumerate(feature_counts):
+        # Calculate percentage for bar width (max 100%)
+        percentage = min(count * 10, 100)  # Assuming max 10 features per sprint
+        
+        parts.append(_FEATURE_DISTRIBUTION_ROW_TMPL.format(number=i + 1, percentage=percentage, count=count))
     
-    html += '</div>'
+    parts.append('</div>')
     
     # Display the HTML
-    components.html(html, height=700 + len(sprints) * 150)
+    components.html("".join(parts), height=100 + len(feature_counts) * 30)
+
+def render_sprint_details(sprints):
+    """Render detailed information for each sprint"""
+    # Create HTML for sprint details
+    parts = [_SPRINT_DETAILS_HEADER]
+    
+    # Each card is cached per sprint's fields, so reruns with unchanged sprints reuse the HTML
+    for sprint in sprints:
+        parts.append(_sprint_detail_card_html(
+            sprint.get('number', 0),
+            sprint.get('duration', 2),
+            tuple(sprint.get('features', [])),
+            sprint.get('goals', "Complete planned features"),
+            sprint.get('dependencies', "None")
+        ))
+    
+    parts.append('</div>')
+    
+    # Display the HTML
+    components.html("".join(parts), height=700 + len(sprints) * 150)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _sprint_detail_card_html(sprint_number, duration, features, goals, dependencies):
+    """
+    Build the details card for one sprint, cached per set of sprint fields
+    
+    Args:
+        sprint_number (int): The sprint number
+        duration (int): The sprint duration in weeks
+        features (tuple): Feature names planned for the sprint
+        goals (str): Main goals of the sprint
+        dependencies (str): Dependencies or blockers
+        
+    Returns:
+        str: HTML for the card, with the feature, goal and dependency text escaped
+    """
+    parts = [_SPRINT_DETAIL_OPEN_TMPL.format(sprint_number=sprint_number, duration=duration, goals=escape(str(goals)))]
+    parts.extend(f'<li>{escape(str(feature))}</li>' for feature in features)
+    parts.append(_SPRINT_DETAIL_CLOSE_TMPL.format(dependencies=escape(str(dependencies))))
+    return "".join(parts)
@@ -1,9 +1,14 @@
 import streamlit.components.v1 as components
 import re
+from html import escape
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 
+# Sprint headers and the tasks listed under them, compiled once
+_SPRINT_HEADER_RE = re.compile(r'Sprint\s+(\d+)[:\s]+([^\n]+)', re.IGNORECASE)
+_TASK_RE = re.compile(r'(?:Task|Feature)\s*(?:\d+)?\s*[:\-]\s*([^\n]+)\s*(?:\n|$)')
+
 def render_sprint_plan_visualization(sprint_plan_text):
     """
     Create visualizations for the sprint plan tab
@@ -38,42 +43,82 @@ def extract_sprint_data(text):
     sprints = []
     tasks = []
     
-    # Try to find sprints
-    sprint_pattern = r'Sprint\s+(\d+)[:\s]+([^\n]+)'
-    sprint_matches = re.findall(sprint_pattern, text, re.IGNORECASE)
-    
-    # Try to find tasks within sprints
-    task_pattern = r'(?:Task|Feature)\s*(?:\d+)?\s*[:\-]\s*([^\n]+)\s*(?:\n|$)'
+    # Find every sprint header in one scan; each sprint's section runs up to the next header
+    sprint_matches = list(_SPRINT_HEADER_RE.finditer(text))
     
     # If we found sprints, extract tasks for each sprint
-    if sprint_matches:
-        for sprint_num, sprint_desc in sprint_matches:
-            sprint_num = int(sprint_num)
-            sprint_section = re.search(f"Sprint\\s+{sprint_num}[:\\s].*?(?=Sprint\\s+\\d+[:\\s]|$)", text, re.DOTALL)
-            
-            if sprint_section:
-                sprint_content = sprint_section.group(0)
-                task_matches = re.findall(task_pattern, sprint_content)
-                
-                # Add tasks to the list
-                for i, task_name in enumerate(task_matches):
-                    tasks.append({
-                        "Task": task_name.strip(),
-                        "Sprint": f"Sprint {sprint_num}",
-                        "Start": sprint_num * 10 - 9 + i,  # Approximate start day
-                        "Duration": 5,  # Default duration
-                        "Resource": "Team"
-                    })
-                
-                # Add sprint to the list
-                sprints.append({
-                    "Sprint": sprint_num,
-                    "Description": sprint_desc.strip(),
-                    "Tasks": len(task_matches)
-                })
+    for index, sprint_match in enumerate(sprint_matches):
+        sprint_num = int(sprint_match.group(1))
+        section_end = sprint_matches[index + 1].start() if index + 1 < len(sprint_matches) else len(text)
+        sprint_content = text[sprint_match.start():section_end]
+        task_matches = _TASK_RE.findall(sprint_content)
+        
+        # Add tasks to the list
+        for i, task_name in enumerate(task_matches):
+            tasks.append({
+                "Task": task_name.strip(),
+                "Sprint": f"Sprint {sprint_num}",
+                "Start": sprint_num * 10 - 9 + i,  # Approximate start day
+                "Duration": 5,  # Default duration
+                "Resource": "Team"
+            })
+        
+        # Add sprint to the list
+        sprints.append({
+            "Sprint": sprint_num,
+            "Description": sprint_match.group(2).strip(),
+            "Tasks": len(task_matches)
+        })
     
     return sprints, tasks
 
+# Static HTML and per-row templates for the timeline and summary table; only the row values are formatted in
+_TIMELINE_HEADER = '''
+    <div style="margin-top: 20px; margin-bottom: 20px;">
+    '''
+
+_TIMELINE_SPRINT_OPEN_TMPL = '''
+        <div style="margin-bottom: 20px;">
+            <div style="display: flex; align-items: center;">
+                <div style="background-color: {color}; color: white; padding: 10px 15px; border-radius: 5px; font-weight: bold; width: 100px; text-align: center;">{sprint_name}</div>
+                <div style="height: 2px; background-color: {color}; flex-grow: 1; margin-left: 10px;"></div>
+            </div>
+            <div style="margin-left: 20px; margin-top: 10px;">
+        '''
+
+_TIMELINE_TASK_TMPL = '''
+                <div style="display: flex; align-items: center; margin-bottom: 8px;">
+                    <div style="width: 20px; height: 20px; background-color: {color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 12px; margin-right: 10px;">{number}</div>
+                    <div>{task}</div>
+                </div>
+                '''
+
+_TIMELINE_SPRINT_CLOSE = '''
+            </div>
+        </div>
+        '''
+
+_SUMMARY_CELL_STYLE = 'padding: 12px; text-align: left; border: 1px solid #ddd;'
+
+_SUMMARY_TABLE_HEADER = "".join((
+    '<div style="padding: 20px; background-color: #f8f9fa; border-radius: 8px; margin-top: 20px;">',
+    '<h3 style="color: #333; margin-bottom: 15px;">Sprint Summary</h3>',
+    '<table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">',
+    '<tr style="background-color: #4CAF50; color: white;">',
+    "".join(f'<th style="{_SUMMARY_CELL_STYLE}">{title}</th>' for title in ("Sprint", "Duration", "Features", "Goals", "Dependencies")),
+    '</tr>'
+))
+
+_SUMMARY_ROW_TMPL = "".join((
+    '<tr style="background-color: white;">',
+    f'<td style="{_SUMMARY_CELL_STYLE}">Sprint {{number}}</td>',
+    f'<td style="{_SUMMARY_CELL_STYLE}">{{duration}} weeks</td>',
+    f'<td style="{_SUMMARY_CELL_STYLE}"><ul style="margin: 0; padding-left: 20px;">{{features}}</ul></td>',
+    f'<td style="{_SUMMARY_CELL_STYLE}">{{goals}}</td>',
+    f'<td style="{_SUMMARY_CELL_STYLE}">{{dependencies}}</td>',
+    '</tr>'
+))
+
 def create_sprint_timeline(sprints, tasks):
     """Create a sprint timeline visualization"""
     # Group tasks by sprint
@@ -85,9 +130,7 @@ def create_sprint_timeline(sprints, tasks):
         tasks_by_sprint[sprint].append(task)
     
     # Create the HTML for the timeline
-    html = '''
-    <div style="margin-top: 20px; margin-bottom: 20px;">
-    '''
+    parts = [_TIMELINE_HEADER]
     
     # Sort sprints by number
     sorted_sprints = sorted(sprints, key=lambda x: x["Sprint"])
@@ -101,72 +144,36 @@ def create_sprint_timeline(sprints, tasks):
         hue = (i * 60) % 360
         color = f"hsl({hue}, 70%, 65%)"
         
-        html += f'''
-        <div style="margin-bottom: 20px;">
-            <div style="display: flex; align-items: center;">
-                <div style="background-color: {color}; color: white; padding: 10px 15px; border-radius: 5px; font-weight: bold; width: 100px; text-align: center;">{sprint_name}</div>
-                <div style="height: 2px; background-color: {color}; flex-grow: 1; margin-left: 10px;"></div>
-            </div>
-            <div style="margin-left: 20px; margin-top: 10px;">
-        '''
+        parts.append(_TIMELINE_SPRINT_OPEN_TMPL.format(color=color, sprint_name=sprint_name))
         
         # Add tasks for this sprint
-        if sprint_name in tasks_by_sprint:
-            for j, task in enumerate(tasks_by_sprint[sprint_name]):
-                html += f'''
-                <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                    <div style="width: 20px; height: 20px; background-color: {color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 12px; margin-right: 10px;">{j+1}</div>
-                    <div>{task["Task"]}</div>
-                </div>
-                '''
+        for j, task in enumerate(tasks_by_sprint.get(sprint_name, ())):
+            parts.append(_TIMELINE_TASK_TMPL.format(color=color, number=j + 1, task=escape(task["Task"])))
         
-        html += '''
-            </div>
-        </div>
-        '''
+        parts.append(_TIMELINE_SPRINT_CLOSE)
     
-    html += '</div>'
+    parts.append('</div>')
     
-    return html
+    return "".join(parts)
 
 def create_sprint_summary_table(sprints):
     """Create a sprint summary table"""
-    html = '<div style="padding: 20px; background-color: #f8f9fa; border-radius: 8px; margin-top: 20px;">'    
-    html += '<h3 style="color: #333; margin-bottom: 15px;">Sprint Summary</h3>'
-    html += '<table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">'    
-    html += '<tr style="background-color: #4CAF50; color: white;">'    
-    html += '<th style="padding: 12px; text-align: left; border: 1px solid #ddd;">Sprint</th>'
-    html += '<th style="padding: 12px; text-align: left; border: 1px solid #ddd;">Duration</th>'
-    html += '<th style="padding: 12px; text-align: left; border: 1px solid #ddd;">Features</th>'
-    html += '<th style="padding: 12px; text-align: left; border: 1px solid #ddd;">Goals</th>'
-    html += '<th style="padding: 12px; text-align: left; border: 1px solid #ddd;">Dependencies</th>'
-    html += '</tr>'
+    parts = [_SUMMARY_TABLE_HEADER]
     
     for sprint in sprints:
-        html += f'<tr style="background-color: white;">'
-        html += f'<td style="padding: 12px; text-align: left; border: 1px solid #ddd;">Sprint {sprint["number"]}</td>'
-        html += f'<td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{sprint.get("duration", 2)} weeks</td>'
-        
         # Format features as a list
-        features = sprint.get("features", [])
-        features_html = '<ul style="margin: 0; padding-left: 20px;">'    
-        for feature in features:
-            features_html += f'<li>{feature}</li>'
-        features_html += '</ul>'
-        html += f'<td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{features_html}</td>'
-        
-        # Add goals
-        html += f'<td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{sprint.get("goals", "Not specified")}</td>'
-        
-        # Add dependencies
-        html += f'<td style="padding: 12px; text-align: left; border: 1px solid #ddd;">{sprint.get("dependencies", "None")}</td>'
-        
-        html += '</tr>'
+        parts.append(_SUMMARY_ROW_TMPL.format(
+            number=sprint["number"],
+            duration=sprint.get("duration", 2),
+            features="".join(f'<li>{escape(str(feature))}</li>' for feature in sprint.get("features", [])),
+            goals=escape(str(sprint.get("goals", "Not specified"))),
+            dependencies=escape(str(sprint.get("dependencies", "None")))
+        ))
     
-    html += '</table>'
-    html += '</div>'
+    parts.append('</table>')
+    parts.append('</div>')
     
-    return html
+    return "".join(parts)
 
 def render_sprint_plan(sprint_plan_data):
     """
@@ -190,7 +197,7 @@ def render_sprint_plan(sprint_plan_data):
         user_priority_focus = sprints[0]['user_priority_focus']
         
         # Display a priority focus banner
-        st.markdown(f"<div class='priority-focus-banner'>Priority Focus: {user_priority_focus}</div>", unsafe_allow_html=True)
+        st.markdown(f"<div class='priority-focus-banner'>Priority Focus: {escape(str(user_priority_focus))}</div>", unsafe_allow_html=True)
     
     # Render sprint timeline
     render_sprint_timeline(sprints, has_priority_focus)
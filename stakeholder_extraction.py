@@ -8,6 +8,19 @@ from direct_agents.task import Task
 import streamlit.components.v1 as components
 import streamlit as st
 
+# Patterns are compiled once at import rather than on every call
+_PRIORITY_ADJUSTMENT_RE = re.compile(r"PRIORITY ADJUSTMENT:\s*(.+?)(?:\n|$)")
+
+# Sections of a stakeholder update for the regex fallback: a heading followed by a run of bullet or numbered lines
+_HIGHLIGHTS_SECTION_RE = re.compile(r'(?:highlights?|achievements?|accomplishments?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', re.IGNORECASE)
+_METRICS_SECTION_RE = re.compile(r'(?:metrics|progress|status)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', re.IGNORECASE)
+_RISKS_SECTION_RE = re.compile(r'(?:risks?|challenges?|issues?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', re.IGNORECASE)
+_NEXT_STEPS_SECTION_RE = re.compile(r'(?:next steps?|recommendations?|future|plan)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', re.IGNORECASE)
+_RESOURCES_SECTION_RE = re.compile(r'(?:resources?|needs?|requests?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', re.IGNORECASE)
+
+# One bullet or numbered item inside a section
+_BULLET_ITEM_RE = re.compile(r'(?:\*|\-|\d+\.)\s*([^\n]+)')
+
 def extract_stakeholder_update_with_llm(stakeholder_update_text, user_priority_focus=None):
     """
     Use the AI agent to extract structured stakeholder update data
@@ -21,7 +34,7 @@ def extract_stakeholder_update_with_llm(stakeholder_update_text, user_priority_f
     """
     # Extract user priority focus if present in the text but not provided as parameter
     if not user_priority_focus and isinstance(stakeholder_update_text, str):
-        priority_match = re.search(r"PRIORITY ADJUSTMENT:\s*(.+?)(?:\n|$)", stakeholder_update_text)
+        priority_match = _PRIORITY_ADJUSTMENT_RE.search(stakeholder_update_text)
         if priority_match:
             user_priority_focus = priority_match.group(1).strip()
     
@@ -196,22 +209,19 @@ def extract_stakeholder_update_with_regex(stakeholder_update_text):
     resources = []
     
     # Extract highlights
-    highlights_section = re.search(r'(?:highlights?|achievements?|accomplishments?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', 
-                                 stakeholder_update_text, re.IGNORECASE)
+    highlights_section = _HIGHLIGHTS_SECTION_RE.search(stakeholder_update_text)
     if highlights_section:
-        highlights = [h.strip() for h in re.findall(r'(?:\*|\-|\d+\.)\s*([^\n]+)', highlights_section.group(1))]
+        highlights = [h.strip() for h in _BULLET_ITEM_RE.findall(highlights_section.group(1))]
     
     # Extract metrics
-    metrics_section = re.search(r'(?:metrics|progress|status)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', 
-                              stakeholder_update_text, re.IGNORECASE)
+    metrics_section = _METRICS_SECTION_RE.search(stakeholder_update_text)
     if metrics_section:
-        metrics = [m.strip() for m in re.findall(r'(?:\*|\-|\d+\.)\s*([^\n]+)', metrics_section.group(1))]
+        metrics = [m.strip() for m in _BULLET_ITEM_RE.findall(metrics_section.group(1))]
     
     # Extract risks
-    risks_section = re.search(r'(?:risks?|challenges?|issues?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', 
-                            stakeholder_update_text, re.IGNORECASE)
+    risks_section = _RISKS_SECTION_RE.search(stakeholder_update_text)
     if risks_section:
-        risk_items = [r.strip() for r in re.findall(r'(?:\*|\-|\d+\.)\s*([^\n]+)', risks_section.group(1))]
+        risk_items = [r.strip() for r in _BULLET_ITEM_RE.findall(risks_section.group(1))]
         for item in risk_items:
             impact = 'Medium'  # Default
             if 'high' in item.lower() or 'critical' in item.lower() or 'severe' in item.lower():
@@ -221,16 +231,14 @@ def extract_stakeholder_update_with_regex(stakeholder_update_text):
             risks.append({'text': item, 'impact': impact})
     
     # Extract next steps
-    next_steps_section = re.search(r'(?:next steps?|recommendations?|future|plan)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', 
-                                 stakeholder_update_text, re.IGNORECASE)
+    next_steps_section = _NEXT_STEPS_SECTION_RE.search(stakeholder_update_text)
     if next_steps_section:
-        next_steps = [s.strip() for s in re.findall(r'(?:\*|\-|\d+\.)\s*([^\n]+)', next_steps_section.group(1))]
+        next_steps = [s.strip() for s in _BULLET_ITEM_RE.findall(next_steps_section.group(1))]
     
     # Extract resources
-    resources_section = re.search(r'(?:resources?|needs?|requests?)[:\n]+((?:(?:\*|\-|\d+\.)[^\n]+\n?)+)', 
-                                stakeholder_update_text, re.IGNORECASE)
+    resources_section = _RESOURCES_SECTION_RE.search(stakeholder_update_text)
     if resources_section:
-        resources = [r.strip() for r in re.findall(r'(?:\*|\-|\d+\.)\s*([^\n]+)', resources_section.group(1))]
+        resources = [r.strip() for r in _BULLET_ITEM_RE.findall(resources_section.group(1))]
     
     return {
         'highlights': highlights,
@@ -256,53 +264,26 @@ def render_stakeholder_update(update_data):
     # Render next steps and resources
     render_action_items(update_data['next_steps'], update_data['resources'])
 
-def render_highlights(highlights):
-    """Render project highlights"""
-    if not highlights:
-        return
-        
-    # Create HTML for highlights
-    html = '''
+# Static HTML and per-item templates for the stakeholder update panels; only the item values are formatted in
+_HIGHLIGHTS_HEADER = '''
     <div style="margin: 20px 0; padding: 15px; background-color: #f5f5f5; border-radius: 8px; border-left: 5px solid #4CAF50;">
         <h3 style="margin-top: 0; color: #333;">Project Highlights</h3>
         <ul style="padding-left: 20px;">
     '''
-    
-    for highlight in highlights:
-        html += f'''
+
+_HIGHLIGHT_ITEM_TMPL = '''
         <li style="margin-bottom: 8px;">
             <span style="color: #4CAF50;">✓</span> {highlight}
         </li>
         '''
-    
-    html += '''
-        </ul>
-    </div>
-    '''
-    
-    # Display the HTML
-    components.html(html, height=50 + len(highlights) * 40)
 
-def render_risks(risks):
-    """Render project risks and challenges"""
-    if not risks:
-        return
-        
-    # Create HTML for risks
-    html = '''
+_RISKS_HEADER = '''
     <div style="margin: 20px 0; padding: 15px; background-color: #f5f5f5; border-radius: 8px; border-left: 5px solid #F44336;">
         <h3 style="margin-top: 0; color: #333;">Risks & Challenges</h3>
         <ul style="padding-left: 20px;">
     '''
-    
-    for risk in risks:
-        risk_text = risk['text'] if isinstance(risk, dict) else risk
-        impact = risk.get('impact', 'Medium') if isinstance(risk, dict) else 'Medium'
-        
-        # Determine color based on impact
-        color = '#F44336' if impact == 'High' else '#FF9800' if impact == 'Medium' else '#2196F3'
-        
-        html += f'''
+
+_RISK_ITEM_TMPL = '''
         <li style="margin-bottom: 8px; display: flex; align-items: baseline;">
             <span style="color: {color}; margin-right: 5px;">⚠</span>
             <div>
@@ -311,63 +292,103 @@ def render_risks(risks):
             </div>
         </li>
         '''
-    
-    html += '''
+
+# Risk badge colors by impact
+_RISK_IMPACT_COLORS = {'High': '#F44336', 'Medium': '#FF9800', 'Low': '#2196F3'}
+
+# Closes the list and panel opened by _HIGHLIGHTS_HEADER or _RISKS_HEADER
+_PANEL_LIST_CLOSE = '''
         </ul>
     </div>
     '''
-    
-    # Display the HTML
-    components.html(html, height=50 + len(risks) * 50)
 
-def render_action_items(next_steps, resources):
-    """Render next steps and resource needs"""
-    # Create HTML for action items
-    html = '''
+_ACTION_ITEMS_HEADER = '''
     <div style="margin: 20px 0; display: flex; flex-wrap: wrap; gap: 20px;">
     '''
-    
-    # Next steps section
-    if next_steps:
-        html += '''
+
+_NEXT_STEPS_HEADER = '''
         <div style="flex: 1; min-width: 300px; padding: 15px; background-color: #f5f5f5; border-radius: 8px; border-left: 5px solid #2196F3;">
             <h3 style="margin-top: 0; color: #333;">Next Steps</h3>
             <ul style="padding-left: 20px;">
         '''
-        
-        for step in next_steps:
-            html += f'''
+
+_NEXT_STEP_ITEM_TMPL = '''
             <li style="margin-bottom: 8px;">
                 <span style="color: #2196F3;">→</span> {step}
             </li>
             '''
-        
-        html += '''
-            </ul>
-        </div>
-        '''
-    
-    # Resources section
-    if resources:
-        html += '''
+
+_RESOURCES_HEADER = '''
         <div style="flex: 1; min-width: 300px; padding: 15px; background-color: #f5f5f5; border-radius: 8px; border-left: 5px solid #9C27B0;">
             <h3 style="margin-top: 0; color: #333;">Resource Needs</h3>
             <ul style="padding-left: 20px;">
         '''
-        
-        for resource in resources:
-            html += f'''
+
+_RESOURCE_ITEM_TMPL = '''
             <li style="margin-bottom: 8px;">
                 <span style="color: #9C27B0;">•</span> {resource}
             </li>
             '''
-        
-        html += '''
+
+# Closes a next steps or resources section
+_ACTION_SECTION_CLOSE = '''
             </ul>
         </div>
         '''
+
+def render_highlights(highlights):
+    """Render project highlights"""
+    if not highlights:
+        return
+        
+    # Create HTML for highlights
+    parts = [_HIGHLIGHTS_HEADER]
+    parts.extend(_HIGHLIGHT_ITEM_TMPL.format(highlight=highlight) for highlight in highlights)
+    parts.append(_PANEL_LIST_CLOSE)
+    
+    # Display the HTML
+    components.html("".join(parts), height=50 + len(highlights) * 40)
+
+def render_risks(risks):
+    """Render project risks and challenges"""
+    if not risks:
+        return
+        
+    # Create HTML for risks
+    parts = [_RISKS_HEADER]
+    
+    for risk in risks:
+        risk_text = risk['text'] if isinstance(risk, dict) else risk
+        impact = risk.get('impact', 'Medium') if isinstance(risk, dict) else 'Medium'
+        
+        # Determine color based on impact (any other impact is shown in blue)
+        color = _RISK_IMPACT_COLORS.get(impact, '#2196F3')
+        
+        parts.append(_RISK_ITEM_TMPL.format(color=color, risk_text=risk_text, impact=impact))
+    
+    parts.append(_PANEL_LIST_CLOSE)
+    
+    # Display the HTML
+    components.html("".join(parts), height=50 + len(risks) * 50)
+
+def render_action_items(next_steps, resources):
+    """Render next steps and resource needs"""
+    # Create HTML for action items
+    parts = [_ACTION_ITEMS_HEADER]
+    
+    # Next steps section
+    if next_steps:
+        parts.append(_NEXT_STEPS_HEADER)
+        parts.extend(_NEXT_STEP_ITEM_TMPL.format(step=step) for step in next_steps)
+        parts.append(_ACTION_SECTION_CLOSE)
+    
+    # Resources section
+    if resources:
+        parts.append(_RESOURCES_HEADER)
+        parts.extend(_RESOURCE_ITEM_TMPL.format(resource=resource) for resource in resources)
+        parts.append(_ACTION_SECTION_CLOSE)
     
-    html += '</div>'
+    parts.append('</div>')
     
     # Display the HTML
-    components.html(html, height=100 + max(len(next_steps), len(resources)) * 30)
+    components.html("".join(parts), height=100 + max(len(next_steps), len(resources)) * 30)
@@ -4,6 +4,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 
+from visualization_utils import highlight_rows
+
 def render_stakeholder_update_visualization(update_text):
     """
     Create visualizations for the stakeholder update tab
@@ -308,15 +310,9 @@ def render_highlights(update_data, has_priority_focus=False):
     # Create and display the DataFrame
     df = pd.DataFrame(data)
     
-    # Apply styling to highlight priority items
-    def highlight_priority(row):
-        if '⭐' in row['Highlight']:
-            return ['background-color: #fff8e1']
-        return ['']
-    
     # Apply the styling if we have priority focus
     if has_priority_focus and priority_highlights:
-        styled_df = df.style.apply(highlight_priority, axis=1)
+        styled_df = df.style.apply(highlight_rows, axis=None, column='Highlight', color='#fff8e1')
         st.dataframe(styled_df, use_container_width=True, height=min(400, len(data) * 35 + 38))
     else:
         st.dataframe(df, use_container_width=True, height=min(400, len(data) * 35 + 38))
@@ -467,15 +463,9 @@ def render_action_items(update_data, has_priority_focus=False):
                 # Create and display the DataFrame
                 df = pd.DataFrame(data)
                 
-                # Apply styling to highlight priority items
-                def highlight_priority(row):
-                    if '⭐' in row['Action']:
-                        return ['background-color: #fff8e1']
-                    return ['']
-                
                 # Apply the styling if we have priority focus
                 if has_priority_focus and priority_next_steps:
-                    styled_df = df.style.apply(highlight_priority, axis=1)
+                    styled_df = df.style.apply(highlight_rows, axis=None, column='Action', color='#fff8e1')
                     st.dataframe(styled_df, use_container_width=True, height=min(400, len(data) * 35 + 38))
                 else:
                     st.dataframe(df, use_container_width=True, height=min(400, len(data) * 35 + 38))
@@ -501,15 +491,9 @@ def render_action_items(update_data, has_priority_focus=False):
                 # Create and display the DataFrame
                 df = pd.DataFrame(data)
                 
-                # Apply styling to highlight priority items
-                def highlight_priority(row):
-                    if '⭐' in row['Resource']:
-                        return ['background-color: #fff8e1']
-                    return ['']
-                
                 # Apply the styling if we have priority focus
                 if has_priority_focus and priority_resources:
-                    styled_df = df.style.apply(highlight_priority, axis=1)
+                    styled_df = df.style.apply(highlight_rows, axis=None, column='Resource', color='#fff8e1')
                     st.dataframe(styled_df, use_container_width=True, height=min(400, len(data) * 35 + 38))
                 else:
                     st.dataframe(df, use_container_width=True, height=min(400, len(data) * 35 + 38))
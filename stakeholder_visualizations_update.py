@@ -73,15 +73,9 @@ def render_highlights(update_data, has_priority_focus=False):
     # Create and display the DataFrame
     df = pd.DataFrame(data)
     
-    # Apply styling to highlight priority items
-    def highlight_priority(row):
-        if '⭐' in row['Highlight']:
-            return ['background-color: #fff8e1']
-        return ['']
-    
     # Apply the styling if we have priority focus
     if has_priority_focus and priority_highlights:
-        styled_df = df.style.apply(highlight_priority, axis=1)
+        styled_df = df.style.apply(highlight_rows, axis=None, column='Highlight', color='#fff8e1')
         st.dataframe(styled_df, use_container_width=True, height=min(400, len(data) * 35 + 38))
     else:
         st.dataframe(df, use_container_width=True, height=min(400, len(data) * 35 + 38))
@@ -232,15 +226,9 @@ def render_action_items(update_data, has_priority_focus=False):
                 # Create and display the DataFrame
                 df = pd.DataFrame(data)
                 
-                # Apply styling to highlight priority items
-                def highlight_priority(row):
-                    if '⭐' in row['Action']:
-                        return ['background-color: #fff8e1']
-                    return ['']
-                
                 # Apply the styling if we have priority focus
                 if has_priority_focus and priority_next_steps:
-                    styled_df = df.style.apply(highlight_priority, axis=1)
+                    styled_df = df.style.apply(highlight_rows, axis=None, column='Action', color='#fff8e1')
                     st.dataframe(styled_df, use_container_width=True, height=min(400, len(data) * 35 + 38))
                 else:
                     st.dataframe(df, use_container_width=True, height=min(400, len(data) * 35 + 38))
@@ -266,15 +254,9 @@ def render_action_items(update_data, has_priority_focus=False):
                 # Create and display the DataFrame
                 df = pd.DataFrame(data)
                 
-                # Apply styling to highlight priority items
-                def highlight_priority(row):
-                    if '⭐' in row['Resource']:
-                        return ['background-color: #fff8e1']
-                    return ['']
-                
                 # Apply the styling if we have priority focus
                 if has_priority_focus and priority_resources:
-                    styled_df = df.style.apply(highlight_priority, axis=1)
+                    styled_df = df.style.apply(highlight_rows, axis=None, column='Resource', color='#fff8e1')
                     st.dataframe(styled_df, use_container_width=True, height=min(500, len(data) * 35 + 38))
                 else:
                     st.dataframe(df, use_container_width=True, height=min(500, len(data) * 35 + 38))
@@ -6,6 +6,8 @@ import re
 from direct_agents.agent import Agent
 from direct_agents.task import Task
 
+from visualization_utils import highlight_rows
+
 def extract_technical_evaluation_with_llm(technical_eval_text, user_priority_focus=None):
     """
     Extract structured technical evaluation data from technical evaluation text using LLM
@@ -526,15 +528,9 @@ def render_challenges_table(features, has_priority_focus=False):
     if data:
         df = pd.DataFrame(data)
         
-        # Apply styling to highlight priority-aligned features
-        def highlight_priority(row):
-            if '⭐' in row['Feature']:
-                return ['background-color: #e6f7e6', 'background-color: #e6f7e6']
-            return ['', '']
-        
         # Apply the styling if we have priority focus
         if has_priority_focus:
-            styled_df = df.style.apply(highlight_priority, axis=1)
+            styled_df = df.style.apply(highlight_rows, axis=None, column='Feature', color='#e6f7e6')
             st.write(styled_df.to_html(escape=False), unsafe_allow_html=True)
         else:
             st.write(df.to_html(escape=False), unsafe_allow_html=True)
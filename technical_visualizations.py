@@ -5,6 +5,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 
+from visualization_utils import highlight_rows
+
 def render_technical_evaluation_visualization(tech_eval_text):
     """
     Create visualizations for the technical evaluation tab
@@ -475,15 +477,9 @@ def render_challenges_table(features, has_priority_focus=False):
     if data:
         df = pd.DataFrame(data)
         
-        # Apply styling to highlight priority-aligned features
-        def highlight_priority(row):
-            if '⭐' in row['Feature']:
-                return ['background-color: #fff8e1'] * len(row)
-            return [''] * len(row)
-        
         # Apply the styling if we have priority focus
         if has_priority_focus:
-            styled_df = df.style.apply(highlight_priority, axis=1)
+            styled_df = df.style.apply(highlight_rows, axis=None, column='Feature', color='#fff8e1')
             st.dataframe(styled_df, use_container_width=True)
         else:
             st.dataframe(df, use_container_width=True)
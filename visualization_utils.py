@@ -0,0 +1,32 @@
+"""
+Shared helpers for the Project Evolution Agents visualization modules.
+"""
+import streamlit as st
+import pandas as pd
+
+# Fragments let a visualization rerun on its own instead of rerunning the whole script.
+# st.fragment needs Streamlit 1.37+ (1.33+ as experimental_fragment); older versions render normally.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Sentiment palette shared by the feedback sentiment bars and the feedback trends graph
+SENTIMENT_COLORS = {
+    "positive": "#4CAF50",  # Green
+    "neutral": "#2196F3",  # Blue
+    "negative": "#F44336"  # Red
+}
+
+def highlight_rows(frame, column, color):
+    """Style the rows whose column text has a ⭐, building the whole style table at once instead of calling back per row
+    
+    Meant for Styler.apply with axis=None, e.g. df.style.apply(highlight_rows, axis=None, column='Feature', color='#fff8e1').
+    
+    Args:
+        frame (pd.DataFrame): The frame being styled
+        column (str): Column whose text marks a highlighted row with a ⭐
+        color (str): Background color for the highlighted rows
+        
+    Returns:
+        pd.DataFrame: CSS for every cell, shaped like frame
+    """
+    row_styles = frame[column].str.contains('⭐', regex=False).map({True: f'background-color: {color}', False: ''})
+    return pd.DataFrame({name: row_styles for name in frame.columns}, index=frame.index)